@@ -4,16 +4,19 @@ import argparse
 import math
 import os
 import re
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinter import font as tkfont
 from urllib.parse import unquote, urlparse
 
-from PIL import Image, ImageEnhance, ImageOps, ImageTk
+import numpy as np
+from PIL import Image, ImageTk
 
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
@@ -23,60 +26,52 @@ except ImportError:  # pragma: no cover - depends on optional dependency
     DND_FILES = None
     TkinterDnD = None
 
+DROP_TOKEN_RE = re.compile(r"{[^}]+}|\S+")
+
 
 def parse_drop_files(data: str) -> List[str]:
     if not data:
         return []
-    tokens = re.findall(r"{[^}]+}|[^\\s]+", data)
+    tokens = DROP_TOKEN_RE.findall(data)
     paths = [normalize_drop_path(token.strip().strip("{}")) for token in tokens]
     return [p for p in paths if p]
 
 
+@lru_cache(maxsize=256)
 def compute_fit_scale(image_size: tuple[int, int], canvas_size: tuple[int, int]) -> float:
+    # Called on every configure/scroll event with a handful of distinct sizes; memoized, and
+    # plain compares instead of min()/max() calls on a miss.
     img_w, img_h = image_size
     canvas_w, canvas_h = canvas_size
-    if img_w <= 0 or img_h <= 0:
+    if img_w <= 0 or img_h <= 0 or canvas_w <= 0 or canvas_h <= 0:
         return 1.0
-    if canvas_w <= 0 or canvas_h <= 0:
+    scale_w = canvas_w / img_w
+    scale_h = canvas_h / img_h
+    scale = scale_w if scale_w < scale_h else scale_h
+    if scale >= 1.0:
         return 1.0
-    scale = min(canvas_w / img_w, canvas_h / img_h, 1.0)
-    return max(scale, 0.05)
+    return scale if scale > 0.05 else 0.05
 
 
 def clamp_scroll_fraction(value: float, scroll_w: float, canvas_w: float) -> float:
-    if scroll_w <= 0:
+    if scroll_w <= 0 or canvas_w >= scroll_w or value <= 0.0:
+        return 0.0
+    max_start = 1.0 - (canvas_w / scroll_w)
+    return max_start if value > max_start else value
+
+
+def center_scroll_fraction(scroll_w: float, canvas_w: float) -> float:
+    # Scroll start that centers a `scroll_w` wide region in a `canvas_w` wide view.
+    if scroll_w <= canvas_w:
         return 0.0
-    max_start = max(0.0, 1.0 - (canvas_w / scroll_w))
-    return min(max(value, 0.0), max_start)
-
-
-def affine_matrix_for_state(state: "TransformState", size: tuple[int, int]) -> tuple[float, float, float, float, float, float]:
-    angle = math.radians(state.angle_deg)
-    ca = math.cos(angle)
-    sa = math.sin(angle)
-    cx = size[0] / 2.0
-    cy = size[1] / 2.0
-    dx = state.dx
-    dy = state.dy
-    a0 = ca
-    a1 = -sa
-    a2 = (-ca * dx) - (ca * cx) + (sa * dy) + (sa * cy) + cx
-    b0 = sa
-    b1 = ca
-    b2 = (-sa * dx) - (sa * cx) - (ca * dy) - (ca * cy) + cy
-    return (a0, a1, a2, b0, b1, b2)
-
-
-def affine_matrix_for_crop(
-    state: "TransformState",
-    size: tuple[int, int],
-    out_x0: int,
-    out_y0: int,
-) -> tuple[float, float, float, float, float, float]:
-    a0, a1, a2, b0, b1, b2 = affine_matrix_for_state(state, size)
-    a2 = a2 + a0 * out_x0 + a1 * out_y0
-    b2 = b2 + b0 * out_x0 + b1 * out_y0
-    return (a0, a1, a2, b0, b1, b2)
+    return (scroll_w - canvas_w) / 2.0 / scroll_w
+
+
+def encode_ppm(image: Image.Image) -> bytes:
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    width, height = image.size
+    return b"P6\n%d %d\n255\n" % (width, height) + image.tobytes()
 
 
 class Tooltip:
@@ -113,13 +108,28 @@ def normalize_drop_path(value: str) -> str:
     return value
 
 from .core import (
+    PILLOW_SIMD_AVAILABLE,
     ChannelStack,
     TransformState,
     add_alignment_tag,
+    affine_matrices_batch,
+    affine_matrix_for_crop,
+    affine_matrix_for_state,
     apply_transform,
+    blend_overlay,
+    blend_uses_base,
+    build_pyramid,
+    cv2_affine_from_pil,
+    display_gray_array,
+    downsample,
+    is_identity,
+    levels_to_uint8,
     load_channels_from_paths,
+    reference_blend_base,
+    resize_array,
     save_channels,
-    to_display_gray,
+    warm_up_kernels,
+    warp_affine,
 )
 
 
@@ -152,6 +162,21 @@ class UiColors:
     highlight: str = "#F2E6D8"
 
 
+@dataclass(frozen=True)
+class ViewportGeom:
+    # Canvas/scroll layout for one render; `visible` is the _viewport_geometry() tuple or None.
+    canvas_w: int
+    canvas_h: int
+    scale: float
+    scroll_w: int
+    scroll_h: int
+    x_fraction: float
+    y_fraction: float
+    x0: float
+    y0: float
+    visible: Optional[tuple[int, int, int, int, float, float, float, float]]
+
+
 class ManualChannelAlignerApp(ttk.Frame):
     SUPPORTED_EXTENSIONS = {".tif", ".tiff", ".png", ".jpg", ".jpeg", ".bmp"}
 
@@ -162,10 +187,15 @@ class ManualChannelAlignerApp(ttk.Frame):
         self.colors = UiColors()
 
         self.channels: List[Image.Image] = []
+        self.channels_np: List[np.ndarray] = []
         self.preview_channels: List[Image.Image] = []
+        self.preview_channels_np: List[np.ndarray] = []
+        self._pyramid: List[List[Image.Image]] = []
+        self._pyramid_np: dict[tuple[int, int], np.ndarray] = {}
         self.preview_scale: float = 1.0
-        self.display_channels: List[Image.Image] = []
-        self.reference_rgb_cache: List[Image.Image] = []
+        self.display_channels: List[Optional[Image.Image]] = []
+        self.display_channels_np: List[Optional[np.ndarray]] = []
+        self._display_levels: tuple = (None, 1.0)
         self.zoom_var = tk.DoubleVar(value=1.0)
         self.zoom_label_var = tk.StringVar(value="Zoom: 100%")
         self._pan_anchor: Optional[tuple[int, int]] = None
@@ -174,9 +204,39 @@ class ManualChannelAlignerApp(ttk.Frame):
         self._scroll_h = 0
         self._canvas_w = 0
         self._canvas_h = 0
-        self._render_job: Optional[str] = None
+        # Last <Configure> size of the canvas, so renders don't ask Tk for it on every frame.
+        self._canvas_size: Optional[tuple[int, int]] = None
+        self._debounce_jobs: dict[str, str] = {}
+        self._draft_job: Optional[str] = None
+        self._preview_dirty = False
+        # Preview pixel budget the current preview channels were built for.
+        self._preview_pixels: Optional[float] = None
         self._overlay_cache_key: Optional[tuple] = None
         self._overlay_cache: Optional[Image.Image] = None
+        self._overlay_cache_box: Optional[tuple[int, int, int, int]] = None
+        self._render_buf: Optional[np.ndarray] = None
+        self._compose_buf: Optional[np.ndarray] = None
+        self._fullres_buf: Optional[np.ndarray] = None
+        self._fullres_ref_cache: Optional[tuple[tuple, np.ndarray]] = None
+        self._fullres_active_cache: Optional[tuple[tuple, np.ndarray]] = None
+        self._moved_cache: Optional[tuple[tuple, np.ndarray]] = None
+        self._blend_base_cache: dict[tuple, np.ndarray] = {}
+        # Device-side copies of display channels for the cv2 preview, keyed by channel index.
+        self._umat_channels: dict[int, object] = {}
+        self._umat_dst: Optional[object] = None
+        self._umat_dst_size: Optional[tuple[int, int]] = None
+        self._warp_dst: Optional[np.ndarray] = None
+        self.photo: Optional[ImageTk.PhotoImage] = None
+        self._canvas_image_id: Optional[int] = None
+        self._pil_tk_bridge = True
+        # cv2 and PIL release the GIL inside warps, so export can transform channels concurrently.
+        self._pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        # The Tk thread blocks on preview resizes, so they get their own workers instead of
+        # queueing behind load and export jobs on _pool.
+        self._preview_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        self._load_future: Optional[Future] = None
+        self._save_future: Optional[Future] = None
+        self._rendered_view_key: Optional[tuple] = None
         self._display_cache_version = 0
         self.fast_preview_var = tk.BooleanVar(value=False)
         self.preview_quality_var = tk.DoubleVar(value=2.0)
@@ -220,12 +280,33 @@ class ManualChannelAlignerApp(ttk.Frame):
         self._build_ui()
         self._bind_keys()
         self._configure_drag_drop()
-
+        # Plain-attribute mirrors of the vars the render path reads, so a frame doesn't pay a
+        # Tcl round-trip per .get().
+        self._opacity = 0.5
+        self._zoom = 1.0
+        self._full_res_view = False
+        self._use_gpu = False
+        self._mirror_var(self.opacity_var, "_opacity", float)
+        self._mirror_var(self.zoom_var, "_zoom", float)
+        self._mirror_var(self.full_res_view_var, "_full_res_view", bool)
+        self._mirror_var(self.use_gpu_var, "_use_gpu", bool)
+
+        self.after_idle(warm_up_kernels)
         if paths:
             self.load_images(paths)
         else:
             self._render_empty_state()
 
+    def _mirror_var(self, var: tk.Variable, attr: str, cast: Callable) -> None:
+        def sync(*_args) -> None:
+            try:
+                setattr(self, attr, cast(var.get()))
+            except (tk.TclError, ValueError):
+                pass
+
+        sync()
+        var.trace_add("write", sync)
+
     def _build_ui(self) -> None:
         self.master.title("Manual Channel Aligner App")
         self.master.minsize(1024, 700)
@@ -369,7 +450,7 @@ class ManualChannelAlignerApp(ttk.Frame):
         self.v_scrollbar.grid(row=0, column=1, sticky="ns")
         self.h_scrollbar.grid(row=1, column=0, sticky="ew")
 
-        self.canvas.bind("<Configure>", lambda _: self._refresh_display())
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
         self.canvas.bind("<Button-1>", lambda _: self.canvas.focus_set())
 
         sidebar = ttk.Frame(body, style="Panel.TFrame", width=self.tokens.sidebar_width)
@@ -729,7 +810,7 @@ class ManualChannelAlignerApp(ttk.Frame):
             self._add_help_icon(header, help_text)
         entry = ttk.Entry(frame, textvariable=variable, style="Aligner.TEntry")
         entry.pack(fill="x", pady=(self.tokens.pad_sm, 0))
-        entry.bind("<FocusOut>", lambda _: self._refresh_display())
+        entry.bind("<FocusOut>", lambda _: self._schedule_render())
         return entry
 
     def _labeled_slider(
@@ -779,8 +860,8 @@ class ManualChannelAlignerApp(ttk.Frame):
 
     def _on_display_adjustment(self) -> None:
         self._update_display_labels()
-        self._rebuild_display_cache()
-        self._render_view(draft=False)
+        self._invalidate_display_cache()
+        self._schedule_render()
 
     def _update_display_labels(self) -> None:
         self.display_min_label_var.set(f"{self.display_min_var.get():.0f}")
@@ -791,8 +872,8 @@ class ManualChannelAlignerApp(ttk.Frame):
         self._update_preview_quality_label()
         if self.fast_preview_var.get():
             return
-        self._rebuild_preview_cache()
-        self._render_view(draft=False)
+        self._preview_dirty = True
+        self._schedule_render()
 
     def _on_fullres_toggle(self) -> None:
         if self.full_res_view_var.get():
@@ -832,12 +913,14 @@ class ManualChannelAlignerApp(ttk.Frame):
         mp = float(self.preview_quality_var.get())
         return max(0.1, mp) * 1_000_000
 
-    def _rebuild_preview_cache(self) -> None:
+    def _rebuild_preview_cache(self, recenter: bool = True) -> None:
+        self._preview_dirty = False
         if not self.channels:
             return
-        self.preview_channels = self._build_preview_channels(self.channels)
+        self._set_preview_channels(self._build_preview_channels(self.channels))
         self._rebuild_display_cache()
-        self._needs_center_view = True
+        if recenter:
+            self._needs_center_view = True
         self._overlay_cache_key = None
         self._overlay_cache = None
 
@@ -926,7 +1009,7 @@ class ManualChannelAlignerApp(ttk.Frame):
     def _is_descendant(self, widget: tk.Widget, ancestor: tk.Widget) -> bool:
         current = widget
         while current is not None:
-            if current == ancestor:
+            if current is ancestor:
                 return True
             current = getattr(current, "master", None)
         return False
@@ -1011,14 +1094,17 @@ class ManualChannelAlignerApp(ttk.Frame):
         return Path(path).suffix.lower() in self.SUPPORTED_EXTENSIONS
 
     def _register_drop_targets(self, widget: tk.Widget) -> None:
-        if hasattr(widget, "drop_target_register"):
-            try:
-                widget.drop_target_register(DND_FILES)
-                widget.dnd_bind("<<Drop>>", self._on_drop)
-            except tk.TclError:
-                self.dnd_enabled = False
-        for child in widget.winfo_children():
-            self._register_drop_targets(child)
+        # Explicit stack instead of recursion: no frame per tree level and no recursion limit.
+        stack = [widget]
+        while stack:
+            current = stack.pop()
+            if hasattr(current, "drop_target_register"):
+                try:
+                    current.drop_target_register(DND_FILES)
+                    current.dnd_bind("<<Drop>>", self._on_drop)
+                except tk.TclError:
+                    self.dnd_enabled = False
+            stack.extend(current.winfo_children())
 
     def _open_images_dialog(self) -> None:
         paths = filedialog.askopenfilenames(
@@ -1032,8 +1118,35 @@ class ManualChannelAlignerApp(ttk.Frame):
             self.load_images(list(paths))
 
     def load_images(self, paths: List[str]) -> None:
+        # Decode in the worker pool so large TIFF stacks don't freeze the window; a newer
+        # request supersedes one still in flight.
+        self._load_future = self._pool.submit(self._load_worker, list(paths))
+        self._set_status("Loading images...")
+        self.after(50, self._poll_load, self._load_future)
+
+    def _load_worker(self, paths: List[str]) -> tuple[ChannelStack, List[List[Image.Image]]]:
+        # Runs on the pool: decode plus the pyramid, which only depends on the pixels. Preview
+        # selection reads widget state, so it stays on the Tk thread in _poll_load.
+        stack = load_channels_from_paths(paths)
+        if len(stack.channels) < 2:
+            return stack, []
+        # Halve until a level fits well inside the smallest preview budget; deeper levels are never picked.
+        pyramid_floor = self.tokens.preview_max_dim // 4
+        pyramid = [
+            build_pyramid(channel, levels=8, array=array, min_dim=pyramid_floor)
+            for channel, array in zip(stack.channels, stack.channels_np)
+        ]
+        return stack, pyramid
+
+    def _poll_load(self, future: Future) -> None:
+        if future is not self._load_future:
+            return
+        if not future.done():
+            self.after(50, self._poll_load, future)
+            return
+        self._load_future = None
         try:
-            stack = load_channels_from_paths(paths)
+            stack, pyramid = future.result()
         except Exception as exc:
             messagebox.showerror("Load failed", str(exc))
             self._render_empty_state()
@@ -1045,7 +1158,10 @@ class ManualChannelAlignerApp(ttk.Frame):
             return
 
         self.channels = stack.channels
-        self.preview_channels = self._build_preview_channels(self.channels)
+        self.channels_np = stack.channels_np
+        self._pyramid = pyramid
+        self._pyramid_np = {}
+        self._set_preview_channels(self._build_preview_channels(self.channels))
         self.transforms = [TransformState() for _ in self.channels]
         self.reference_index = 0
         self.active_index = 1
@@ -1157,8 +1273,9 @@ class ManualChannelAlignerApp(ttk.Frame):
     def _pan_key(self, dx: int, dy: int, event: tk.Event) -> None:
         if self._should_ignore_key():
             return
-        step_x = max(20, int(self.canvas.winfo_width() * 0.05))
-        step_y = max(20, int(self.canvas.winfo_height() * 0.05))
+        canvas_w, canvas_h = self._canvas_extent()
+        step_x = max(20, int(canvas_w * 0.05))
+        step_y = max(20, int(canvas_h * 0.05))
         if self._is_shift(event):
             step_x *= 3
             step_y *= 3
@@ -1227,26 +1344,121 @@ class ManualChannelAlignerApp(ttk.Frame):
             return self._auto_display_range(self.preview_channels[index])
         return None
 
+    def _opacity_alpha8(self) -> int:
+        # Opacity quantized once to 8-bit alpha; cache keys and blend weights all use this value.
+        return int(round(self._opacity * 255))
+
+    def _reference_blend_base(self, alpha8: int) -> np.ndarray:
+        # Only the moving channel changes while nudging, so keep the reference term of the blend.
+        key = (self.reference_index, alpha8, self._display_cache_version)
+        base = self._blend_base_cache.get(key)
+        if base is None:
+            self._blend_base_cache.clear()
+            base = reference_blend_base(self.display_channels_np[self.reference_index], alpha8 / 255.0)
+            self._blend_base_cache[key] = base
+        return base
+
+    def _invalidate_display_cache(self) -> None:
+        # The next render rebuilds the display cache; bumping the version keeps the view key fresh.
+        self.display_channels = []
+        self.display_channels_np = []
+        self._display_cache_version += 1
+        self._overlay_cache_key = None
+        self._overlay_cache = None
+        self._blend_base_cache.clear()
+        self._umat_channels.clear()
+
     def _rebuild_display_cache(self) -> None:
         if not self.preview_channels:
             self.display_channels = []
-            self.reference_rgb_cache = []
+            self.display_channels_np = []
             return
         self.display_channels = []
-        self.reference_rgb_cache = []
+        self.display_channels_np = []
         self._display_cache_version += 1
         self._overlay_cache_key = None
         self._overlay_cache = None
-        manual_range = self._display_range()
-        brightness = float(self.brightness_var.get())
-        for channel in self.preview_channels:
-            display_range = manual_range if manual_range is not None else self._auto_display_range(channel)
-            gray = to_display_gray(channel, display_range=display_range)
-            if abs(brightness - 1.0) > 0.01:
-                gray = ImageEnhance.Brightness(gray).enhance(brightness)
-            self.display_channels.append(gray)
-            base = Image.merge("RGB", (gray, gray, gray))
-            self.reference_rgb_cache.append(base)
+        self._blend_base_cache.clear()
+        self._umat_channels.clear()
+        # Only the reference and active channels are drawn; the rest are levelled on first use,
+        # with the settings captured here.
+        self._display_levels = (self._display_range(), float(self.brightness_var.get()))
+        self.display_channels = [None] * len(self.preview_channels)
+        self.display_channels_np = [None] * len(self.preview_channels)
+        self._ensure_display_channel(self.reference_index)
+        self._ensure_display_channel(self.active_index)
+
+    def _ensure_display_channel(self, idx: int) -> None:
+        if idx >= len(self.display_channels) or self.display_channels[idx] is not None:
+            return
+        manual_range, brightness = self._display_levels
+        display_range = manual_range
+        if display_range is None:
+            display_range = self._auto_display_range_for_index(idx, use_full=True)
+        gray_np = display_gray_array(
+            self.preview_channels[idx], display_range, brightness, array=self.preview_channels_np[idx]
+        )
+        self.display_channels[idx] = Image.fromarray(gray_np)
+        self.display_channels_np[idx] = gray_np
+
+    def _on_canvas_configure(self, event: tk.Event) -> None:
+        self._canvas_size = (event.width, event.height)
+        self._schedule_render()
+
+    def _canvas_extent(self) -> tuple[int, int]:
+        # Before the first <Configure> (canvas not mapped yet) fall back to asking Tk.
+        if self._canvas_size is None:
+            return self.canvas.winfo_width(), self.canvas.winfo_height()
+        return self._canvas_size
+
+    def _compute_geom(self, base_size: tuple[int, int]) -> ViewportGeom:
+        # One read of the canvas size and scroll position per render; everything else derives from it.
+        canvas_w, canvas_h = self._canvas_extent()
+        canvas_w = max(canvas_w, 1)
+        canvas_h = max(canvas_h, 1)
+        fit_scale = compute_fit_scale(base_size, (canvas_w, canvas_h))
+        scale = max(fit_scale * self._zoom, 0.05)
+        disp_w = max(int(base_size[0] * scale), 1)
+        disp_h = max(int(base_size[1] * scale), 1)
+        scroll_w = max(canvas_w, disp_w)
+        scroll_h = max(canvas_h, disp_h)
+
+        if self._needs_center_view:
+            x_fraction = center_scroll_fraction(scroll_w, canvas_w)
+            y_fraction = center_scroll_fraction(scroll_h, canvas_h)
+        else:
+            xview = self.canvas.xview()
+            yview = self.canvas.yview()
+            x_fraction = clamp_scroll_fraction(xview[0] if xview else 0.0, scroll_w, canvas_w)
+            y_fraction = clamp_scroll_fraction(yview[0] if yview else 0.0, scroll_h, canvas_h)
+
+        x0 = x_fraction * scroll_w
+        y0 = y_fraction * scroll_h
+        return ViewportGeom(
+            canvas_w=canvas_w,
+            canvas_h=canvas_h,
+            scale=scale,
+            scroll_w=scroll_w,
+            scroll_h=scroll_h,
+            x_fraction=x_fraction,
+            y_fraction=y_fraction,
+            x0=x0,
+            y0=y0,
+            visible=self._viewport_geometry(base_size, scale, canvas_w, canvas_h, scroll_w, scroll_h, x0, y0),
+        )
+
+    def _present(self, geom: ViewportGeom, image: Image.Image, pos_x: int, pos_y: int) -> None:
+        self._scroll_w = geom.scroll_w
+        self._scroll_h = geom.scroll_h
+        self._canvas_w = geom.canvas_w
+        self._canvas_h = geom.canvas_h
+
+        self._show_photo(image, pos_x, pos_y)
+        self.canvas.configure(scrollregion=(0, 0, geom.scroll_w, geom.scroll_h))
+        self.canvas.xview_moveto(geom.x_fraction)
+        self.canvas.yview_moveto(geom.y_fraction)
+        if self._needs_center_view:
+            self._needs_center_view = False
 
     def _viewport_geometry(
         self,
@@ -1287,44 +1499,84 @@ class ManualChannelAlignerApp(ttk.Frame):
         out_w: int,
         out_h: int,
         resample: int,
+        array: Optional[np.ndarray] = None,
     ) -> Image.Image:
-        if not state.dx and not state.dy and not state.angle_deg:
+        if is_identity(state):
             return image.crop((out_x0, out_y0, out_x0 + out_w, out_y0 + out_h))
         matrix = affine_matrix_for_crop(state, image.size, out_x0, out_y0)
-        return image.transform((out_w, out_h), Image.AFFINE, matrix, resample=resample, fillcolor=0)
+        out = self._warp_buffer((out_w, out_h), array.dtype) if array is not None else None
+        return warp_affine(image, matrix, (out_w, out_h), resample, array=array, out=out)
 
-    def _transform_preview(self, image: Image.Image, state: TransformState) -> Image.Image:
-        if self.use_gpu_var.get() and self.gpu_available and getattr(self, "_cv2", None):
+    def _warp_buffer(self, size: tuple[int, int], dtype) -> np.ndarray:
+        # One scratch output for the preview/viewport warps; the result is blended straight away,
+        # so nothing holds on to it across frames. Export warps run in parallel and allocate their own.
+        width, height = size
+        buf = self._warp_dst
+        if buf is None or buf.shape != (height, width) or buf.dtype != dtype:
+            buf = np.empty((height, width), dtype=dtype)
+            self._warp_dst = buf
+        return buf
+
+    def _transform_preview(
+        self,
+        image: Image.Image,
+        state: TransformState,
+        index: Optional[int] = None,
+    ) -> Image.Image:
+        # `index` names the display channel `image` came from, so its cached array/UMat can be reused.
+        if is_identity(state):
+            # Callers only read the result, so the untouched channel can be handed back as is.
+            return image
+        array = self.display_channels_np[index] if index is not None else None
+        out = self._warp_buffer(image.size, array.dtype) if array is not None else None
+        if self._use_gpu and self.gpu_available and getattr(self, "_cv2", None):
             try:
-                return self._transform_preview_cv2(image, state)
+                return self._transform_preview_cv2(image, state, index=index)
             except Exception:
-                return apply_transform(image, state, Image.BILINEAR)
-        return apply_transform(image, state, Image.BILINEAR)
+                return apply_transform(image, state, Image.BILINEAR, array=array, out=out)
+        return apply_transform(image, state, Image.BILINEAR, array=array, out=out)
 
-    def _transform_preview_cv2(self, image: Image.Image, state: TransformState) -> Image.Image:
+    def _transform_preview_cv2(
+        self,
+        image: Image.Image,
+        state: TransformState,
+        index: Optional[int] = None,
+    ) -> Image.Image:
         cv2 = self._cv2
         np = self._np
+        array = self.display_channels_np[index] if index is not None else None
         if cv2 is None or np is None:
-            return apply_transform(image, state, Image.BILINEAR)
-        arr = np.array(image, dtype=np.uint8)
+            return apply_transform(image, state, Image.BILINEAR, array=array)
+        arr = array if array is not None else np.asarray(image, dtype=np.uint8)
         height, width = arr.shape[:2]
-        center = (width / 2.0, height / 2.0)
-        matrix = cv2.getRotationMatrix2D(center, float(state.angle_deg), 1.0)
-        matrix[0, 2] += float(state.dx)
-        matrix[1, 2] += float(state.dy)
-        src = cv2.UMat(arr) if hasattr(cv2, "UMat") else arr
+        # Same memoized inverse matrix the CPU warp uses, so toggling GPU never shifts the overlay.
+        matrix = cv2_affine_from_pil(affine_matrix_for_state(state, (width, height)))
+        src = arr
+        dst = self._warp_buffer((width, height), np.uint8)
+        if hasattr(cv2, "UMat"):
+            # Upload each display channel once per display-cache rebuild, not once per frame.
+            src = self._umat_channels.get(index) if index is not None else None
+            if src is None:
+                src = cv2.UMat(arr)
+                if index is not None:
+                    self._umat_channels[index] = src
+            if self._umat_dst is None or self._umat_dst_size != (width, height):
+                self._umat_dst = cv2.UMat(height, width, cv2.CV_8UC1)
+                self._umat_dst_size = (width, height)
+            dst = self._umat_dst
         warped = cv2.warpAffine(
             src,
             matrix,
             (width, height),
-            flags=cv2.INTER_LINEAR,
+            dst=dst,
+            flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
             borderMode=cv2.BORDER_CONSTANT,
             borderValue=0,
         )
         if hasattr(warped, "get"):
             warped = warped.get()
-        warped = warped.astype("uint8", copy=False)
-        return Image.fromarray(warped, mode="L")
+        # warpAffine keeps the uint8 source depth, and fromarray wraps 2-D uint8 without copying.
+        return Image.fromarray(warped)
 
     def _is_shift(self, event: tk.Event) -> bool:
         return bool(event.state & 0x0001)
@@ -1339,7 +1591,8 @@ class ManualChannelAlignerApp(ttk.Frame):
         if self.active_index == self.reference_index:
             self.active_index = (self.active_index + 1) % len(self.channels)
         self.active_var.set(f"Channel {self.active_index + 1}")
-        self._refresh_display()
+        # Held Tab auto-repeats; coalesce like the other key-driven renders.
+        self._schedule_render()
         self._update_status_for_active()
         return "break"
 
@@ -1347,19 +1600,22 @@ class ManualChannelAlignerApp(ttk.Frame):
         if not self._has_channels():
             return
         self.transforms[self.active_index] = TransformState()
-        self._refresh_display()
+        self._schedule_render()
         self._update_status_for_active()
 
     def _reset_all(self) -> None:
         if not self._has_channels():
             return
         self.transforms = [TransformState() for _ in self.transforms]
-        self._refresh_display()
+        self._schedule_render()
         self._set_status(self._status_with_preview_scale("All transforms reset."))
 
     def _save_aligned(self) -> None:
         if not self._has_channels():
             return
+        if self._save_future is not None:
+            self._set_status("A save is already in progress.")
+            return
 
         initial_dir = os.path.dirname(self.source_paths[0]) if self.source_paths else None
         output_path = None
@@ -1387,17 +1643,63 @@ class ManualChannelAlignerApp(ttk.Frame):
                 continue
             break
 
+        resample = self._resample_method()
+        # Snapshot the stack and states so nudges or a new load while the export runs don't leak into it.
+        channels = list(self.channels)
+        arrays = list(self.channels_np)
+        states = [replace(state) for state in self.transforms]
+        matrices = affine_matrices_batch(
+            [state.angle_deg for state in states],
+            [state.dx for state in states],
+            [state.dy for state in states],
+            [channel.size for channel in channels],
+        )
+        channel_futures = [
+            self._pool.submit(
+                self._aligned_channel,
+                channels[idx],
+                arrays[idx],
+                states[idx],
+                tuple(matrices[idx]),
+                resample,
+                idx == self.reference_index,
+            )
+            for idx in range(len(channels))
+        ]
+        # Submitted after the warps, so the pool's FIFO queue starts them before this job waits on them.
+        self._save_future = self._pool.submit(
+            self._write_aligned, channel_futures, output_path, add_alignment_tag(self.tiffinfo), self.save_kwargs
+        )
+        self._set_status("Saving aligned stack...")
+        self.after(50, self._poll_save, self._save_future, output_path)
+
+    def _aligned_channel(
+        self,
+        channel: Image.Image,
+        array: np.ndarray,
+        state: TransformState,
+        matrix: tuple,
+        resample: int,
+        is_reference: bool,
+    ) -> Image.Image:
+        if is_reference:
+            return channel.copy()
+        return apply_transform(channel, state, resample, matrix=matrix, array=array)
+
+    def _write_aligned(self, channel_futures: List[Future], output_path: str, tiffinfo, save_kwargs) -> None:
+        aligned = [future.result() for future in channel_futures]
+        save_channels(aligned, output_path, tiffinfo=tiffinfo, save_kwargs=save_kwargs)
+
+    def _poll_save(self, future: Future, output_path: str) -> None:
+        if not future.done():
+            self.after(50, self._poll_save, future, output_path)
+            return
+        self._save_future = None
         try:
-            aligned = []
-            for idx, channel in enumerate(self.channels):
-                if idx == self.reference_index:
-                    aligned.append(channel.copy())
-                else:
-                    aligned.append(apply_transform(channel, self.transforms[idx], self._resample_method()))
-            tiffinfo = add_alignment_tag(self.tiffinfo)
-            save_channels(aligned, output_path, tiffinfo=tiffinfo, save_kwargs=self.save_kwargs)
+            future.result()
         except Exception as exc:
             messagebox.showerror("Save failed", str(exc))
+            self._set_status("Save failed.")
             return
 
         self.last_save_path = output_path
@@ -1429,22 +1731,51 @@ class ManualChannelAlignerApp(ttk.Frame):
         scale_dim = min(1.0, self.tokens.preview_max_dim / max_dim)
         max_pixels = self._preview_target_pixels()
         scale_area = min(1.0, math.sqrt(max_pixels / float(width * height)))
-        scale = min(scale_dim, scale_area, 1.0)
+        scale = min(scale_dim, scale_area, 1.0, self._zoom_level_scale(size))
         return max(scale, 0.05)
 
+    def _zoom_level_scale(self, size: tuple[int, int]) -> float:
+        # Coarsest pyramid level that still has at least one source pixel per screen pixel.
+        canvas_w, canvas_h = self._canvas_extent()
+        if canvas_w <= 1 or canvas_h <= 1 or self._full_res_view:
+            return 1.0
+        view_scale = compute_fit_scale(size, (canvas_w, canvas_h)) * self._zoom
+        levels = len(self._pyramid[0]) if self._pyramid else 1
+        level_scale = 1.0
+        for _ in range(levels - 1):
+            if level_scale / 2.0 < view_scale:
+                break
+            level_scale /= 2.0
+        return level_scale
+
     def _build_preview_channels(self, channels: List[Image.Image]) -> List[Image.Image]:
         if not channels:
             self.preview_scale = 1.0
             return []
         self.preview_scale = self._compute_preview_scale(channels[0].size)
+        self._preview_pixels = self._preview_target_pixels()
         if self.preview_scale >= 0.999:
             return channels
-        preview = []
-        for channel in channels:
-            width, height = channel.size
-            new_size = (max(int(width * self.preview_scale), 1), max(int(height * self.preview_scale), 1))
-            preview.append(channel.resize(new_size, resample=Image.BILINEAR))
-        return preview
+        # cv2 and PIL both release the GIL while resizing, so channels scale in parallel.
+        return list(self._preview_pool.map(self._preview_channel, range(len(channels)), channels))
+
+    def _preview_channel(self, idx: int, channel: Image.Image) -> Image.Image:
+        width, height = channel.size
+        new_size = (max(int(width * self.preview_scale), 1), max(int(height * self.preview_scale), 1))
+        source = channel
+        for level in self._pyramid[idx] if idx < len(self._pyramid) else ():
+            if level.size[0] >= new_size[0] and level.size[1] >= new_size[1]:
+                source = level
+        if source.size == new_size:
+            return source
+        return downsample(source, new_size, array=self.channels_np[idx] if source is channel else None)
+
+    def _set_preview_channels(self, preview: List[Image.Image]) -> None:
+        self.preview_channels = preview
+        if preview is self.channels:
+            self.preview_channels_np = self.channels_np
+        else:
+            self.preview_channels_np = [np.asarray(channel) for channel in preview]
 
     def _scaled_state(self, state: TransformState) -> TransformState:
         if self.preview_scale >= 0.999:
@@ -1461,138 +1792,243 @@ class ManualChannelAlignerApp(ttk.Frame):
         percent = int(round(self.preview_scale * 100))
         return f"{message} Preview: {percent}% (export full res)."
 
+    def _state_key(self) -> tuple:
+        # Integer buckets (1/16 rendered pixel, 0.001 deg, 8-bit opacity) so float drift from
+        # repeated nudges doesn't defeat the cache.
+        state = self.transforms[self.active_index]
+        scale = 16.0 * (1.0 if self._full_res_view else self.preview_scale)
+        return (
+            self.reference_index,
+            self.active_index,
+            int(round(state.angle_deg * 1000)),
+            int(round(state.dx * scale)),
+            int(round(state.dy * scale)),
+            self._opacity_alpha8(),
+            self._display_cache_version,
+        )
+
+    def _view_key(self) -> tuple:
+        xview = self.canvas.xview()
+        yview = self.canvas.yview()
+        canvas_w, canvas_h = self._canvas_extent()
+        return self._state_key() + (
+            self._full_res_view,
+            round(self._zoom, 4),
+            round(xview[0], 4) if xview else 0.0,
+            round(yview[0], 4) if yview else 0.0,
+            canvas_w,
+            canvas_h,
+            self._needs_center_view,
+        )
+
+    def _debounce(self, key: str, delay_ms: int, callback: Callable[[], None]) -> None:
+        # Trailing-edge debounce: every call pushes `callback` back by `delay_ms`.
+        job = self._debounce_jobs.pop(key, None)
+        if job is not None:
+            self.after_cancel(job)
+        self._debounce_jobs[key] = self.after(delay_ms, self._run_debounced, key, callback)
+
+    def _run_debounced(self, key: str, callback: Callable[[], None]) -> None:
+        self._debounce_jobs.pop(key, None)
+        callback()
+
     def _schedule_render(self) -> None:
+        # Bursts of UI events collapse into one draft per event-loop pass (after_idle runs once the
+        # queued motion/wheel events are drained) plus one trailing final render.
+        if (
+            self.channels
+            and "render" not in self._debounce_jobs
+            and not self._preview_dirty
+            and self._view_key() == self._rendered_view_key
+        ):
+            return
+        if self._draft_job is None:
+            self._draft_job = self.after_idle(self._render_draft)
+        self._debounce("render", 120, self._render_final)
+
+    def _render_draft(self) -> None:
+        self._draft_job = None
         self._render_view(draft=True)
-        if self._render_job is not None:
-            self.after_cancel(self._render_job)
-        self._render_job = self.after(120, self._render_final)
 
     def _render_final(self) -> None:
-        self._render_job = None
+        if self._preview_dirty:
+            # A quality change re-centers; a zoom that only crossed a pyramid level keeps the view.
+            self._rebuild_preview_cache(recenter=self._preview_target_pixels() != self._preview_pixels)
         self._render_view(draft=False)
 
     def _render_view(self, draft: bool = False) -> None:
         if not self.channels:
             self._render_empty_state()
             return
-        if self.full_res_view_var.get():
+        self._clamp_zoom()
+        self._rendered_view_key = None if draft else self._view_key()
+        if self._full_res_view:
             self._render_fullres_view(draft=draft)
             return
-        self._clamp_zoom()
         self._update_zoom_label()
 
-        if not self.display_channels or not self.reference_rgb_cache:
+        if abs(self._compute_preview_scale(self.channels[0].size) - self.preview_scale) > 1e-6:
+            if draft:
+                # Drafts keep showing the current preview; the trailing final render resizes once.
+                self._preview_dirty = True
+            else:
+                self._rebuild_preview_cache(recenter=False)
+        if not self.display_channels or not self.display_channels_np:
             self._rebuild_display_cache()
-
-        key = (
-            self.reference_index,
-            self.active_index,
-            round(self.transforms[self.active_index].dx, 4),
-            round(self.transforms[self.active_index].dy, 4),
-            round(self.transforms[self.active_index].angle_deg, 4),
-            round(float(self.opacity_var.get()), 4),
-            self._display_cache_version,
-        )
-        if self._overlay_cache_key != key or self._overlay_cache is None:
-            reference_rgb = self.reference_rgb_cache[self.reference_index]
-            active_gray = self.display_channels[self.active_index]
-            moved = self._transform_preview(active_gray, self._scaled_state(self.transforms[self.active_index]))
-            overlay_rgb = ImageOps.colorize(moved, black=(0, 0, 0), white=(240, 90, 90))
-            alpha_value = int(max(0.0, min(float(self.opacity_var.get()), 1.0)) * 255)
-            alpha = Image.new("L", moved.size, alpha_value)
-            overlay = overlay_rgb.copy()
-            overlay.putalpha(alpha)
-            composed = reference_rgb.convert("RGBA")
-            composed.alpha_composite(overlay)
-            self._overlay_cache = composed.convert("RGB")
-            self._overlay_cache_key = key
-
-        canvas_w = max(self.canvas.winfo_width(), 1)
-        canvas_h = max(self.canvas.winfo_height(), 1)
-        fit_scale = compute_fit_scale(self._overlay_cache.size, (canvas_w, canvas_h))
-        zoom = float(self.zoom_var.get())
-        scale = max(fit_scale * zoom, 0.05)
-        disp_w = max(int(self._overlay_cache.size[0] * scale), 1)
-        disp_h = max(int(self._overlay_cache.size[1] * scale), 1)
-        scroll_w = max(canvas_w, disp_w)
-        scroll_h = max(canvas_h, disp_h)
-
-        if self._needs_center_view:
-            x_fraction = 0.0
-            y_fraction = 0.0
-            if scroll_w > canvas_w:
-                x_fraction = max((scroll_w - canvas_w) / 2.0, 0.0) / scroll_w
-            if scroll_h > canvas_h:
-                y_fraction = max((scroll_h - canvas_h) / 2.0, 0.0) / scroll_h
-        else:
-            xview = self.canvas.xview()
-            yview = self.canvas.yview()
-            x_fraction = clamp_scroll_fraction(xview[0] if xview else 0.0, scroll_w, canvas_w)
-            y_fraction = clamp_scroll_fraction(yview[0] if yview else 0.0, scroll_h, canvas_h)
-
-        x0 = x_fraction * scroll_w
-        y0 = y_fraction * scroll_h
-
-        rendered = self._render_viewport(
-            self._overlay_cache,
-            scale=scale,
-            canvas_w=canvas_w,
-            canvas_h=canvas_h,
-            scroll_w=scroll_w,
-            scroll_h=scroll_h,
-            x0=x0,
-            y0=y0,
-            draft=draft,
-        )
-        if rendered is None:
+        self._ensure_display_channel(self.reference_index)
+        self._ensure_display_channel(self.active_index)
+
+        preview_size = self.display_channels[self.reference_index].size
+        geom = self._compute_geom(preview_size)
+        overlay, pos_x, pos_y = self._render_viewport(preview_size, geom, draft=draft)
+        self._present(geom, overlay, pos_x, pos_y)
+
+    def _blit_photo(self, image: Image.Image) -> ImageTk.PhotoImage:
+        # Reuse the Tk photo while the viewport size is stable; paste() is one copy into Tk.
+        if not self._pil_tk_bridge:
+            return self._blit_ppm(image)
+        photo = self.photo
+        if photo is None or (photo.width(), photo.height()) != image.size:
+            photo = ImageTk.PhotoImage("RGB", image.size)
+            self.photo = photo
+        try:
+            photo.paste(image)
+        except (tk.TclError, ImportError):
+            # Pillow's Tk bridge can't be loaded into this Tk; plain PPM data works everywhere.
+            self._pil_tk_bridge = False
+            return self._blit_ppm(image)
+        return photo
+
+    def _blit_ppm(self, image: Image.Image) -> tk.PhotoImage:
+        self.photo = tk.PhotoImage(master=self.canvas, data=encode_ppm(image), format="PPM")
+        return self.photo
+
+    def _show_photo(self, image: Image.Image, pos_x: int, pos_y: int) -> None:
+        # One persistent canvas item; each frame only swaps its photo and moves it.
+        previous = self.photo
+        photo = self._blit_photo(image)
+        if self._canvas_image_id is None:
+            self._canvas_image_id = self.canvas.create_image(pos_x, pos_y, image=photo, anchor="nw")
             return
-        overlay, pos_x, pos_y = rendered
-        self._scroll_w = scroll_w
-        self._scroll_h = scroll_h
-        self._canvas_w = canvas_w
-        self._canvas_h = canvas_h
+        if photo is not previous:
+            # An in-place paste already redraws the item; only a new photo needs rebinding.
+            self.canvas.itemconfigure(self._canvas_image_id, image=photo)
+        self.canvas.coords(self._canvas_image_id, pos_x, pos_y)
 
+    def _clear_canvas(self) -> None:
         self.canvas.delete("all")
-        self.photo = ImageTk.PhotoImage(overlay)
-        self.canvas.create_image(pos_x, pos_y, image=self.photo, anchor="nw")
-        self.canvas.configure(scrollregion=(0, 0, scroll_w, scroll_h))
-        self.canvas.xview_moveto(x_fraction)
-        self.canvas.yview_moveto(y_fraction)
-        if self._needs_center_view:
-            self._needs_center_view = False
+        self._canvas_image_id = None
 
     def _render_viewport(
         self,
-        base: Image.Image,
-        *,
-        scale: float,
-        canvas_w: int,
-        canvas_h: int,
-        scroll_w: int,
-        scroll_h: int,
-        x0: float,
-        y0: float,
+        base_size: tuple[int, int],
+        geom: ViewportGeom,
         draft: bool = False,
-    ) -> Optional[tuple[Image.Image, int, int]]:
-        geometry = self._viewport_geometry(base.size, scale, canvas_w, canvas_h, scroll_w, scroll_h, x0, y0)
-        if geometry is None:
-            return (Image.new("RGB", (1, 1), self.colors.canvas_bg), int(x0), int(y0))
-        _, _, offset_x, offset_y, vis_x0, vis_y0, vis_x1, vis_y1 = geometry
+    ) -> tuple[Image.Image, int, int]:
+        if geom.visible is None:
+            return (Image.new("RGB", (1, 1), self.colors.canvas_bg), int(geom.x0), int(geom.y0))
+        scale = geom.scale
+        _, _, offset_x, offset_y, vis_x0, vis_y0, vis_x1, vis_y1 = geom.visible
 
         base_x0 = int(vis_x0 / scale)
         base_y0 = int(vis_y0 / scale)
-        base_x1 = min(int(math.ceil(vis_x1 / scale)), base.size[0])
-        base_y1 = min(int(math.ceil(vis_y1 / scale)), base.size[1])
+        base_x1 = min(int(math.ceil(vis_x1 / scale)), base_size[0])
+        base_y1 = min(int(math.ceil(vis_y1 / scale)), base_size[1])
 
-        crop = base.crop((base_x0, base_y0, base_x1, base_y1))
+        _, origin_x, origin_y = self._overlay_region(base_size, (base_x0, base_y0, base_x1, base_y1))
+        # Slice the blend buffer (a view) and scale it straight into the persistent compose buffer.
+        region = self._render_buf[base_y0 - origin_y : base_y1 - origin_y, base_x0 - origin_x : base_x1 - origin_x]
         vis_w = int(vis_x1 - vis_x0)
         vis_h = int(vis_y1 - vis_y0)
         resample = Image.NEAREST if draft else Image.BILINEAR
-        crop = crop.resize((vis_w, vis_h), resample=resample)
+        self._compose_buf = resize_array(region, (vis_w, vis_h), resample, out=self._compose_buf)
+        crop = Image.frombuffer("RGB", (vis_w, vis_h), self._compose_buf, "raw", "RGB", 0, 1)
         pos_x = int(offset_x + vis_x0)
         pos_y = int(offset_y + vis_y0)
         return (crop, pos_x, pos_y)
 
+    def _overlay_region(
+        self,
+        base_size: tuple[int, int],
+        box: tuple[int, int, int, int],
+    ) -> tuple[Image.Image, int, int]:
+        # Blended overlay covering `box` (preview coords) plus the origin of the returned image.
+        # Zoomed in, only a padded window around the visible area is warped; pans that stay
+        # inside it reuse the cached window.
+        key = self._state_key()
+        cached = self._overlay_cache_box
+        if (
+            self._overlay_cache is not None
+            and self._overlay_cache_key == key
+            and cached is not None
+            and cached[0] <= box[0]
+            and cached[1] <= box[1]
+            and cached[2] >= box[2]
+            and cached[3] >= box[3]
+        ):
+            return self._overlay_cache, cached[0], cached[1]
+
+        width, height = base_size
+        pad_x = (box[2] - box[0]) // 2
+        pad_y = (box[3] - box[1]) // 2
+        window = (
+            max(box[0] - pad_x, 0),
+            max(box[1] - pad_y, 0),
+            min(box[2] + pad_x, width),
+            min(box[3] + pad_y, height),
+        )
+        if (window[2] - window[0]) * (window[3] - window[1]) * 2 > width * height:
+            window = (0, 0, width, height)
+        win_x0, win_y0, win_x1, win_y1 = window
+
+        # The warped window doesn't depend on opacity (key[5]), so an opacity drag only re-blends.
+        warp_key = key[:5] + key[6:] + (window,)
+        if self._moved_cache is not None and self._moved_cache[0] == warp_key:
+            moved_np = self._moved_cache[1]
+        else:
+            state = self._scaled_state(self.transforms[self.active_index])
+            active_gray = self.display_channels[self.active_index]
+            if window == (0, 0, width, height):
+                moved = self._transform_preview(active_gray, state, index=self.active_index)
+            else:
+                moved = self._transform_crop(
+                    active_gray,
+                    state,
+                    win_x0,
+                    win_y0,
+                    win_x1 - win_x0,
+                    win_y1 - win_y0,
+                    resample=Image.BILINEAR,
+                    array=self.display_channels_np[self.active_index],
+                )
+            if moved is active_gray:
+                moved_np = self.display_channels_np[self.active_index]
+            else:
+                # asarray() copies out of PIL, so the kept array never aliases the warp scratch buffer.
+                moved_np = np.asarray(moved)
+            self._moved_cache = (warp_key, moved_np)
+        alpha8 = self._opacity_alpha8()
+        opacity = alpha8 / 255.0
+        reference_np = self.display_channels_np[self.reference_index]
+        base = None
+        if blend_uses_base(reference_np, moved_np):
+            # Only the NumPy path reads the cached reference term; cv2 scales the reference itself.
+            base = self._reference_blend_base(alpha8)[win_y0:win_y1, win_x0:win_x1]
+        self._render_buf = blend_overlay(
+            reference_np[win_y0:win_y1, win_x0:win_x1],
+            moved_np,
+            (240, 90, 90),
+            opacity,
+            out=self._render_buf,
+            base=base,
+        )
+        # Wrap the blend buffer without copying; it is only rewritten when the cache misses.
+        buf_h, buf_w = self._render_buf.shape[:2]
+        self._overlay_cache = Image.frombuffer("RGB", (buf_w, buf_h), self._render_buf, "raw", "RGB", 0, 1)
+        self._overlay_cache_key = key
+        self._overlay_cache_box = window
+        return self._overlay_cache, win_x0, win_y0
+
     def _render_fullres_view(self, draft: bool = False) -> None:
         if not self.channels:
             self._render_empty_state()
@@ -1601,46 +2037,28 @@ class ManualChannelAlignerApp(ttk.Frame):
         self._update_zoom_label()
 
         base_size = self.channels[0].size
-        canvas_w = max(self.canvas.winfo_width(), 1)
-        canvas_h = max(self.canvas.winfo_height(), 1)
-        fit_scale = compute_fit_scale(base_size, (canvas_w, canvas_h))
-        zoom = float(self.zoom_var.get())
-        scale = max(fit_scale * zoom, 0.05)
-        disp_w = max(int(base_size[0] * scale), 1)
-        disp_h = max(int(base_size[1] * scale), 1)
-        scroll_w = max(canvas_w, disp_w)
-        scroll_h = max(canvas_h, disp_h)
-
-        if self._needs_center_view:
-            x_fraction = 0.0
-            y_fraction = 0.0
-            if scroll_w > canvas_w:
-                x_fraction = max((scroll_w - canvas_w) / 2.0, 0.0) / scroll_w
-            if scroll_h > canvas_h:
-                y_fraction = max((scroll_h - canvas_h) / 2.0, 0.0) / scroll_h
-        else:
-            xview = self.canvas.xview()
-            yview = self.canvas.yview()
-            x_fraction = clamp_scroll_fraction(xview[0] if xview else 0.0, scroll_w, canvas_w)
-            y_fraction = clamp_scroll_fraction(yview[0] if yview else 0.0, scroll_h, canvas_h)
-
-        x0 = x_fraction * scroll_w
-        y0 = y_fraction * scroll_h
-
-        geometry = self._viewport_geometry(base_size, scale, canvas_w, canvas_h, scroll_w, scroll_h, x0, y0)
-        if geometry is None:
-            self.canvas.delete("all")
+        geom = self._compute_geom(base_size)
+        if geom.visible is None:
+            self._clear_canvas()
             return
-        _, _, offset_x, offset_y, vis_x0, vis_y0, vis_x1, vis_y1 = geometry
-
-        base_x0 = int(vis_x0 / scale)
-        base_y0 = int(vis_y0 / scale)
-        base_x1 = min(int(math.ceil(vis_x1 / scale)), base_size[0])
-        base_y1 = min(int(math.ceil(vis_y1 / scale)), base_size[1])
-
-        ref_channel = self.channels[self.reference_index]
-        active_channel = self.channels[self.active_index]
+        scale = geom.scale
+        _, _, offset_x, offset_y, vis_x0, vis_y0, vis_x1, vis_y1 = geom.visible
+
+        # Zoomed-out drafts read a coarser pyramid level, so a drag doesn't warp and level
+        # the whole full-resolution frame only to shrink it again.
+        level = self._fullres_draft_level(scale) if draft else 0
+        ref_channel = self._pyramid_level(self.reference_index, level)
+        active_channel = self._pyramid_level(self.active_index, level)
+        level_sx = active_channel.size[0] / base_size[0]
+        level_sy = active_channel.size[1] / base_size[1]
         state = self.transforms[self.active_index]
+        if level:
+            state = TransformState(dx=state.dx * level_sx, dy=state.dy * level_sy, angle_deg=state.angle_deg)
+
+        base_x0 = int(vis_x0 / scale * level_sx)
+        base_y0 = int(vis_y0 / scale * level_sy)
+        base_x1 = min(int(math.ceil(vis_x1 / scale * level_sx)), active_channel.size[0])
+        base_y1 = min(int(math.ceil(vis_y1 / scale * level_sy)), active_channel.size[1])
 
         manual_range = self._display_range()
         ref_range = manual_range
@@ -1650,58 +2068,98 @@ class ManualChannelAlignerApp(ttk.Frame):
             active_range = self._auto_display_range_for_index(self.active_index, use_full=True)
         brightness = float(self.brightness_var.get())
 
-        ref_crop = ref_channel.crop((base_x0, base_y0, base_x1, base_y1))
-        ref_gray = to_display_gray(ref_crop, display_range=ref_range)
-        if abs(brightness - 1.0) > 0.01:
-            ref_gray = ImageEnhance.Brightness(ref_gray).enhance(brightness)
-        ref_rgb = Image.merge("RGB", (ref_gray, ref_gray, ref_gray))
+        # Levelled crops are kept per side, so opacity changes and nudges reuse the untouched one.
+        box = (base_x0, base_y0, base_x1, base_y1)
+        ref_key = (self.reference_index, level, box, ref_range, brightness, self._display_cache_version)
+        if self._fullres_ref_cache is not None and self._fullres_ref_cache[0] == ref_key:
+            ref_gray = self._fullres_ref_cache[1]
+        else:
+            if ref_range is None:
+                # Flat channel: the autocontrast fallback needs a PIL crop.
+                ref_gray = display_gray_array(ref_channel.crop(box), None, brightness)
+            else:
+                # Slicing the channel array is a view; levels read it in place.
+                ref_view = self._pyramid_array(self.reference_index, level)[base_y0:base_y1, base_x0:base_x1]
+                ref_gray = levels_to_uint8(ref_view, ref_range, brightness)
+            self._fullres_ref_cache = (ref_key, ref_gray)
 
-        crop_w = max(base_x1 - base_x0, 1)
-        crop_h = max(base_y1 - base_y0, 1)
         resample = Image.NEAREST if draft else Image.BILINEAR
-        active_crop = self._transform_crop(active_channel, state, base_x0, base_y0, crop_w, crop_h, resample=resample)
-        active_gray = to_display_gray(active_crop, display_range=active_range)
-        if abs(brightness - 1.0) > 0.01:
-            active_gray = ImageEnhance.Brightness(active_gray).enhance(brightness)
-
-        overlay_rgb = ImageOps.colorize(active_gray, black=(0, 0, 0), white=(240, 90, 90))
-        alpha_value = int(max(0.0, min(float(self.opacity_var.get()), 1.0)) * 255)
-        alpha = Image.new("L", active_gray.size, alpha_value)
-        overlay = overlay_rgb.copy()
-        overlay.putalpha(alpha)
-        composed = ref_rgb.convert("RGBA")
-        composed.alpha_composite(overlay)
-        composed = composed.convert("RGB")
+        active_key = (
+            self.active_index,
+            level,
+            box,
+            (state.dx, state.dy, state.angle_deg),
+            active_range,
+            brightness,
+            resample,
+            self._display_cache_version,
+        )
+        if self._fullres_active_cache is not None and self._fullres_active_cache[0] == active_key:
+            active_gray = self._fullres_active_cache[1]
+        elif is_identity(state) and active_range is not None:
+            active_view = self._pyramid_array(self.active_index, level)[base_y0:base_y1, base_x0:base_x1]
+            active_gray = levels_to_uint8(active_view, active_range, brightness)
+            self._fullres_active_cache = (active_key, active_gray)
+        else:
+            crop_w = max(base_x1 - base_x0, 1)
+            crop_h = max(base_y1 - base_y0, 1)
+            active_crop = self._transform_crop(
+                active_channel,
+                state,
+                base_x0,
+                base_y0,
+                crop_w,
+                crop_h,
+                resample=resample,
+                array=self._pyramid_array(self.active_index, level),
+            )
+            active_gray = display_gray_array(active_crop, active_range, brightness)
+            self._fullres_active_cache = (active_key, active_gray)
+
+        # Composite in NumPy; the only PIL image is the wrapper handed to the resize and blit.
+        alpha8 = self._opacity_alpha8()
+        self._fullres_buf = blend_overlay(ref_gray, active_gray, (240, 90, 90), alpha8 / 255.0, out=self._fullres_buf)
 
         vis_w = max(int(vis_x1 - vis_x0), 1)
         vis_h = max(int(vis_y1 - vis_y0), 1)
-        if composed.size != (vis_w, vis_h):
-            composed = composed.resize((vis_w, vis_h), resample=Image.NEAREST if draft else Image.BILINEAR)
-
-        self._scroll_w = scroll_w
-        self._scroll_h = scroll_h
-        self._canvas_w = canvas_w
-        self._canvas_h = canvas_h
-
-        self.canvas.delete("all")
-        self.photo = ImageTk.PhotoImage(composed)
-        pos_x = int(offset_x + vis_x0)
-        pos_y = int(offset_y + vis_y0)
-        self.canvas.create_image(pos_x, pos_y, image=self.photo, anchor="nw")
-        self.canvas.configure(scrollregion=(0, 0, scroll_w, scroll_h))
-        self.canvas.xview_moveto(x_fraction)
-        self.canvas.yview_moveto(y_fraction)
-        if self._needs_center_view:
-            self._needs_center_view = False
+        self._compose_buf = resize_array(self._fullres_buf, (vis_w, vis_h), resample, out=self._compose_buf)
+        composed = Image.frombuffer("RGB", (vis_w, vis_h), self._compose_buf, "raw", "RGB", 0, 1)
+        self._present(geom, composed, int(offset_x + vis_x0), int(offset_y + vis_y0))
+
+    def _fullres_draft_level(self, scale: float) -> int:
+        # Coarsest pyramid level that still has at least one source pixel per screen pixel.
+        levels = len(self._pyramid[0]) if self._pyramid else 1
+        level = 0
+        level_scale = 1.0
+        while level + 1 < levels and level_scale / 2.0 >= scale:
+            level_scale /= 2.0
+            level += 1
+        return level
+
+    def _pyramid_level(self, idx: int, level: int) -> Image.Image:
+        if level == 0:
+            return self.channels[idx]
+        return self._pyramid[idx][level]
+
+    def _pyramid_array(self, idx: int, level: int) -> np.ndarray:
+        if level == 0:
+            return self.channels_np[idx]
+        # asarray() copies out of PIL, so keep one array per level instead of one per draft.
+        array = self._pyramid_np.get((idx, level))
+        if array is None:
+            array = np.asarray(self._pyramid[idx][level])
+            self._pyramid_np[(idx, level)] = array
+        return array
 
     def _refresh_display(self) -> None:
         self._render_view(draft=False)
 
     def _scale_for_zoom(self, image: Image.Image) -> Image.Image:
-        canvas_w = max(self.canvas.winfo_width(), 1)
-        canvas_h = max(self.canvas.winfo_height(), 1)
+        canvas_w, canvas_h = self._canvas_extent()
+        canvas_w = max(canvas_w, 1)
+        canvas_h = max(canvas_h, 1)
         fit_scale = compute_fit_scale(image.size, (canvas_w, canvas_h))
-        zoom = float(self.zoom_var.get())
+        zoom = self._zoom
         scale = max(fit_scale * zoom, 0.05)
         new_w = max(int(image.size[0] * scale), 1)
         new_h = max(int(image.size[1] * scale), 1)
@@ -1712,32 +2170,28 @@ class ManualChannelAlignerApp(ttk.Frame):
     def _center_view(self, scroll_w: int, scroll_h: int, canvas_w: int, canvas_h: int) -> None:
         if scroll_w <= 0 or scroll_h <= 0:
             return
-        if scroll_w <= canvas_w:
-            x_fraction = 0.0
-        else:
-            x0 = max((scroll_w - canvas_w) / 2.0, 0.0)
-            x_fraction = x0 / scroll_w
-        if scroll_h <= canvas_h:
-            y_fraction = 0.0
-        else:
-            y0 = max((scroll_h - canvas_h) / 2.0, 0.0)
-            y_fraction = y0 / scroll_h
-        self.canvas.xview_moveto(x_fraction)
-        self.canvas.yview_moveto(y_fraction)
+        self.canvas.xview_moveto(center_scroll_fraction(scroll_w, canvas_w))
+        self.canvas.yview_moveto(center_scroll_fraction(scroll_h, canvas_h))
 
     def _render_empty_state(self) -> None:
-        self.canvas.delete("all")
+        self._clear_canvas()
         message = "Drop images here or click Open Images\n(2+ channels required)"
         if not self.dnd_enabled:
             message += "\\nDrag & drop disabled (install tkinterdnd2)"
+        canvas_w, canvas_h = self._canvas_extent()
         self.canvas.create_text(
-            self.canvas.winfo_width() // 2,
-            self.canvas.winfo_height() // 2,
+            canvas_w // 2,
+            canvas_h // 2,
             text=message,
             fill=self.colors.highlight,
             font=self.fonts["section"],
         )
-        self._set_status("No images loaded.")
+        self._set_status(f"No images loaded. {self._backend_status()}")
+
+    def _backend_status(self) -> str:
+        # Startup report of the optional speedups in use, next to the GPU probe result.
+        pillow = "Pillow-SIMD" if PILLOW_SIMD_AVAILABLE else "Pillow"
+        return f"({self.gpu_status} | {pillow})"
 
     def _set_status(self, message: str) -> None:
         self.status_var.set(message)
@@ -1754,6 +2208,8 @@ class ManualChannelAlignerApp(ttk.Frame):
         return bool(self.channels)
 
     def _quit(self) -> None:
+        self._pool.shutdown(wait=False)
+        self._preview_pool.shutdown(wait=False)
         self.master.destroy()
 
 
@@ -1,9 +1,44 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, List, Optional, Sequence
 
-from PIL import Image, ImageOps, TiffImagePlugin
+import numpy as np
+import PIL
+from PIL import Image, ImageOps, ImageSequence, TiffImagePlugin
+
+try:
+    import cv2  # type: ignore
+    CV2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    cv2 = None
+    CV2_AVAILABLE = False
+
+try:
+    from numba import njit, prange  # type: ignore
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    njit = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+try:
+    import numexpr  # type: ignore
+    NUMEXPR_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    numexpr = None
+    NUMEXPR_AVAILABLE = False
+
+# Pillow-SIMD publishes versions like "9.5.0.post1"; stock Pillow never uses a .post suffix.
+PILLOW_SIMD_AVAILABLE = ".post" in getattr(PIL, "__version__", "")
+
+# PIL modes that round-trip through cv2 without changing dtype. "I" stays on PIL: cv2's
+# remap has no int32 kernel, and a float64 detour is no faster than Image.transform.
+_CV2_MODE_DTYPES = {"L": np.uint8, "I;16": np.uint16, "F": np.float32}
+# Modes whose np.asarray()/fromarray() round trip is lossless, for the integer-shift copy.
+_SHIFT_MODES = ("L", "I;16", "I", "F", "RGB")
 
 
 @dataclass
@@ -19,21 +54,188 @@ class ChannelStack:
     source_paths: List[str]
     tiffinfo: Optional[TiffImagePlugin.ImageFileDirectory_v2] = None
     save_kwargs: Optional[dict] = None
+    channels_np: Optional[List[np.ndarray]] = None
+
+    def __post_init__(self) -> None:
+        if self.channels_np is None:
+            self.channels_np = [np.asarray(channel) for channel in self.channels]
+
+
+AffineMatrix = tuple[float, float, float, float, float, float]
+
+
+def affine_matrices_batch(
+    angles_deg: Sequence[float],
+    dxs: Sequence[float],
+    dys: Sequence[float],
+    sizes: Sequence[tuple[int, int]],
+) -> np.ndarray:
+    # One row of PIL ``Image.AFFINE`` data (output -> input) per transform.
+    angle = np.radians(np.asarray(angles_deg, dtype=np.float64))
+    dx = np.asarray(dxs, dtype=np.float64)
+    dy = np.asarray(dys, dtype=np.float64)
+    size = np.asarray(sizes, dtype=np.float64).reshape(-1, 2)
+    ca = np.cos(angle)
+    sa = np.sin(angle)
+    cx = size[:, 0] / 2.0
+    cy = size[:, 1] / 2.0
+    out = np.empty((angle.shape[0], 6), dtype=np.float64)
+    out[:, 0] = ca
+    out[:, 1] = -sa
+    out[:, 2] = (-ca * dx) - (ca * cx) + (sa * dy) + (sa * cy) + cx
+    out[:, 3] = sa
+    out[:, 4] = ca
+    out[:, 5] = (-sa * dx) - (sa * cx) - (ca * dy) - (ca * cy) + cy
+    return out
 
 
-def apply_transform(image: Image.Image, state: TransformState, resample: int) -> Image.Image:
-    out = image.copy()
-    if state.angle_deg:
-        out = out.rotate(state.angle_deg, resample=resample, expand=False, fillcolor=0)
-    if state.dx or state.dy:
-        out = out.transform(
-            out.size,
-            Image.AFFINE,
-            (1, 0, -state.dx, 0, 1, -state.dy),
-            resample=resample,
-            fillcolor=0,
-        )
-    return out
+def affine_matrix_for_state(state: TransformState, size: tuple[int, int]) -> AffineMatrix:
+    return _affine_matrix(float(state.angle_deg), float(state.dx), float(state.dy), tuple(size))
+
+
+@lru_cache(maxsize=64)
+def _affine_matrix(angle_deg: float, dx: float, dy: float, size: tuple[int, int]) -> AffineMatrix:
+    # Draft, final, pan and zoom renders re-use the same state; keyed on exact values.
+    row = affine_matrices_batch([angle_deg], [dx], [dy], [size])[0]
+    return tuple(float(v) for v in row)
+
+
+def affine_matrix_for_crop(
+    state: TransformState,
+    size: tuple[int, int],
+    out_x0: int,
+    out_y0: int,
+) -> AffineMatrix:
+    a0, a1, a2, b0, b1, b2 = affine_matrix_for_state(state, size)
+    a2 = a2 + a0 * out_x0 + a1 * out_y0
+    b2 = b2 + b0 * out_x0 + b1 * out_y0
+    return (a0, a1, a2, b0, b1, b2)
+
+
+def is_identity(state: TransformState) -> bool:
+    return not state.dx and not state.dy and not state.angle_deg
+
+
+def apply_transform(
+    image: Image.Image,
+    state: TransformState,
+    resample: int,
+    matrix: Optional[AffineMatrix] = None,
+    array: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
+) -> Image.Image:
+    if is_identity(state):
+        return image.copy()
+    if matrix is None:
+        matrix = affine_matrix_for_state(state, image.size)
+    return warp_affine(image, matrix, image.size, resample, array=array, out=out)
+
+
+def warp_affine(
+    image: Image.Image,
+    matrix: AffineMatrix,
+    size: tuple[int, int],
+    resample: int,
+    array: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
+) -> Image.Image:
+    # ``size`` may be smaller than the image: only that output window is resampled.
+    # ``out`` is written into when its shape and dtype fit; the result then aliases it.
+    a0, a1, a2, b0, b1, b2 = matrix
+    if (
+        a0 == 1.0
+        and b1 == 1.0
+        and a1 == 0.0
+        and b0 == 0.0
+        and float(a2).is_integer()
+        and float(b2).is_integer()
+        and image.mode in _SHIFT_MODES
+    ):
+        return _shift_integer(image, int(a2), int(b2), size, array=array, out=out)
+    if CV2_AVAILABLE and image.mode in _CV2_MODE_DTYPES:
+        return _warp_affine_cv2(image, matrix, size, resample, array=array, out=out)
+    if _numba_usable() and image.mode == "L" and resample == Image.BILINEAR:
+        src = array if array is not None else np.asarray(image)
+        dst = _fitting_buffer(out, (size[1], size[0]), np.uint8)
+        _warp_bilinear_u8(src, dst, *(float(v) for v in matrix))
+        return Image.fromarray(dst)
+    return image.transform(size, Image.AFFINE, tuple(matrix), resample=resample, fillcolor=0)
+
+
+def cv2_affine_from_pil(matrix: AffineMatrix) -> np.ndarray:
+    # PIL samples at pixel centers (x + 0.5); cv2 samples at integer pixel coordinates.
+    a0, a1, a2, b0, b1, b2 = matrix
+    return np.array(
+        [
+            [a0, a1, a2 + 0.5 * (a0 + a1) - 0.5],
+            [b0, b1, b2 + 0.5 * (b0 + b1) - 0.5],
+        ],
+        dtype=np.float32,
+    )
+
+
+def cv2_interpolation(resample: int) -> int:
+    if resample == Image.NEAREST:
+        return cv2.INTER_NEAREST
+    if resample == Image.BICUBIC:
+        return cv2.INTER_CUBIC
+    return cv2.INTER_LINEAR
+
+
+def _warp_affine_cv2(
+    image: Image.Image,
+    matrix: AffineMatrix,
+    size: tuple[int, int],
+    resample: int,
+    array: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
+) -> Image.Image:
+    dtype = _CV2_MODE_DTYPES[image.mode]
+    arr = array if array is not None else np.asarray(image)
+    if arr.dtype != dtype:
+        arr = arr.astype(dtype)
+    warped = cv2.warpAffine(
+        arr,
+        cv2_affine_from_pil(matrix),
+        size,
+        dst=_fitting_buffer(out, (size[1], size[0]), dtype),
+        flags=cv2_interpolation(resample) | cv2.WARP_INVERSE_MAP,
+        borderMode=cv2.BORDER_CONSTANT,
+        borderValue=0,
+    )
+    return Image.fromarray(warped)
+
+
+def _shift_integer(
+    image: Image.Image,
+    offset_x: int,
+    offset_y: int,
+    size: tuple[int, int],
+    array: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
+) -> Image.Image:
+    # Integer translation is a copy: every resampling filter returns exactly these pixels,
+    # so the overlapping block is sliced across and the rest zero-filled.
+    src = array if array is not None else np.asarray(image)
+    width, height = size
+    dst = _fitting_buffer(out, (height, width) + src.shape[2:], src.dtype)
+    x0, x1 = max(0, -offset_x), min(width, src.shape[1] - offset_x)
+    y0, y1 = max(0, -offset_y), min(height, src.shape[0] - offset_y)
+    if x1 <= x0 or y1 <= y0:
+        dst.fill(0)
+        return Image.fromarray(dst)
+    dst[:y0] = 0
+    dst[y1:] = 0
+    dst[y0:y1, :x0] = 0
+    dst[y0:y1, x1:] = 0
+    dst[y0:y1, x0:x1] = src[y0 + offset_y : y1 + offset_y, x0 + offset_x : x1 + offset_x]
+    return Image.fromarray(dst)
+
+
+def _fitting_buffer(out: Optional[np.ndarray], shape: tuple[int, ...], dtype) -> np.ndarray:
+    if out is not None and out.shape == shape and out.dtype == dtype:
+        return out
+    return np.empty(shape, dtype=dtype)
 
 
 def to_display_gray(
@@ -48,13 +250,164 @@ def to_display_gray(
     return ImageOps.autocontrast(image)
 
 
+def display_gray_array(
+    image: Image.Image,
+    display_range: Optional[tuple[float, float]] = None,
+    brightness: float = 1.0,
+    array: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # ndarray twin of to_display_gray with brightness folded in, for callers that composite in NumPy.
+    if display_range is not None:
+        return levels_to_uint8(array if array is not None else np.asarray(image), display_range, brightness)
+    gray = np.asarray(to_display_gray(image))
+    if _brightness_gain(brightness) == 1.0:
+        return gray
+    return levels_to_uint8(gray, (0.0, 255.0), brightness)
+
+
+def levels_to_uint8(
+    array: np.ndarray,
+    display_range: tuple[float, float],
+    brightness: float = 1.0,
+) -> np.ndarray:
+    min_val, max_val = display_range
+    if max_val <= min_val:
+        return np.clip(array, 0, 255).astype(np.uint8)
+    if array.dtype == np.uint8:
+        lut = _levels_lut(float(min_val), float(max_val), float(brightness))
+        if CV2_AVAILABLE:
+            return cv2.LUT(array, lut)
+        return np.take(lut, array)
+    if _numba_usable() and array.dtype == np.uint16 and array.ndim == 2:
+        out = np.empty(array.shape, dtype=np.uint8)
+        gain = _brightness_gain(brightness)
+        scale = np.float32(255.0 / (max_val - min_val)) * np.float32(gain)
+        _levels_u16_to_u8(array, np.float32(min_val), scale, np.float32(255 * min(gain, 1.0)), out)
+        return out
+    if NUMEXPR_AVAILABLE and numexpr.get_num_threads() > 1:
+        return _levels_numexpr(array, min_val, max_val, brightness)
+    return _levels_kernel(array, min_val, max_val, brightness)
+
+
+def _brightness_gain(brightness: float) -> float:
+    # Slider values within 1% of 1.0 are treated as "no brightness change".
+    return float(brightness) if abs(brightness - 1.0) > 0.01 else 1.0
+
+
+@lru_cache(maxsize=16)
+def _levels_lut(min_val: float, max_val: float, brightness: float) -> np.ndarray:
+    # 8-bit inputs only have 256 possible values, so map those once. A 65536-entry
+    # table for 16-bit data gathers slower than the arithmetic kernel.
+    lut = _levels_kernel(np.arange(256, dtype=np.float32), min_val, max_val, brightness)
+    lut.flags.writeable = False
+    return lut
+
+
+def _levels_kernel(array: np.ndarray, min_val: float, max_val: float, brightness: float) -> np.ndarray:
+    # clip((x - min) * scale, 0, 255) * b, capped at 255 == clip((x - min) * scale * b, 0, 255 * min(b, 1)):
+    # brightness rides on the scale so the whole mapping is one subtract, one multiply and one clip.
+    gain = _brightness_gain(brightness)
+    out = np.subtract(array, min_val, dtype=np.float32)
+    np.multiply(out, np.float32(255.0 / (max_val - min_val)) * np.float32(gain), out=out)
+    np.clip(out, 0, 255 * min(gain, 1.0), out=out)
+    return out.astype(np.uint8)
+
+
+def _levels_numexpr(array: np.ndarray, min_val: float, max_val: float, brightness: float) -> np.ndarray:
+    # numexpr threads the affine part in cache-sized chunks; single-threaded it loses to NumPy.
+    gain = _brightness_gain(brightness)
+    local_dict = {
+        "x": array,
+        "lo": np.float32(min_val),
+        "scale": np.float32(255.0 / (max_val - min_val)) * np.float32(gain),
+    }
+    out = numexpr.evaluate("(x - lo) * scale", local_dict=local_dict)
+    np.clip(out, 0, 255 * min(gain, 1.0), out=out)
+    return out.astype(np.uint8)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _levels_u16_to_u8(array, min_val, scale, high, out):  # pragma: no cover - compiled
+        # Same float32 math as _levels_kernel in one pass per row, without the full-size temporary.
+        height, width = array.shape
+        low = np.float32(0.0)
+        for y in prange(height):
+            for x in range(width):
+                value = (np.float32(array[y, x]) - min_val) * scale
+                if value < low:
+                    value = low
+                elif value > high:
+                    value = high
+                out[y, x] = np.uint8(value)
+
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _warp_bilinear_u8(src, dst, a0, a1, a2, b0, b1, b2):  # pragma: no cover - compiled
+        # PIL AFFINE semantics: sample at output pixel centers, zero outside the source,
+        # edge-clamped neighbours inside it.
+        height, width = src.shape
+        out_h, out_w = dst.shape
+        for y in prange(out_h):
+            yc = y + 0.5
+            for x in range(out_w):
+                xc = x + 0.5
+                xin = a0 * xc + a1 * yc + a2
+                yin = b0 * xc + b1 * yc + b2
+                if xin < 0.0 or yin < 0.0 or xin >= width or yin >= height:
+                    dst[y, x] = 0
+                    continue
+                xs = xin - 0.5
+                ys = yin - 0.5
+                x0 = int(np.floor(xs))
+                y0 = int(np.floor(ys))
+                fx = xs - x0
+                fy = ys - y0
+                x1 = min(x0 + 1, width - 1)
+                y1 = min(y0 + 1, height - 1)
+                x0 = max(x0, 0)
+                y0 = max(y0, 0)
+                top = src[y0, x0] * (1.0 - fx) + src[y0, x1] * fx
+                bottom = src[y1, x0] * (1.0 - fx) + src[y1, x1] * fx
+                dst[y, x] = np.uint8(top * (1.0 - fy) + bottom * fy)
+
+
+def _numba_usable() -> bool:
+    # Parallel kernels are only launched from the main (Tk) thread: the TBB layer can hang
+    # interpreter exit once worker threads have used it, and the workqueue layer aborts on
+    # concurrent launches. Worker threads already run in parallel on the NumPy/PIL paths.
+    return NUMBA_AVAILABLE and threading.current_thread() is threading.main_thread()
+
+
+def warm_up_kernels() -> None:
+    # Compile (or load from the on-disk cache) the optional Numba kernels before the first render.
+    if not _numba_usable():
+        return
+    levels_to_uint8(np.zeros((8, 8), dtype=np.uint16), (0.0, 1.0))
+    _warp_bilinear_u8(np.zeros((8, 8), dtype=np.uint8), np.empty((8, 8), dtype=np.uint8), 1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+
 def tint_channel(
     gray_image: Image.Image,
     color: tuple[int, int, int],
     display_range: Optional[tuple[float, float]] = None,
 ) -> Image.Image:
     gray = to_display_gray(gray_image, display_range=display_range)
-    return ImageOps.colorize(gray, black=(0, 0, 0), white=color)
+    return _apply_tint(gray, color)
+
+
+@lru_cache(maxsize=8)
+def tint_lut(color: tuple[int, int, int]) -> np.ndarray:
+    # (256, 3) uint8 table equal to ImageOps.colorize(black=(0, 0, 0), white=color), built once per color.
+    ramp = Image.frombytes("L", (256, 1), bytes(range(256)))
+    lut = np.asarray(ImageOps.colorize(ramp, black=(0, 0, 0), white=color)).reshape(256, 3).copy()
+    lut.flags.writeable = False
+    return lut
+
+
+def _apply_tint(gray: Image.Image, color: tuple[int, int, int]) -> Image.Image:
+    return Image.fromarray(np.take(tint_lut(tuple(color)), np.asarray(gray), axis=0))
 
 
 def compose_overlay(
@@ -65,22 +418,155 @@ def compose_overlay(
     alpha_mode: str = "intensity",
     display_range: Optional[tuple[float, float]] = None,
 ) -> Image.Image:
-    base_gray = to_display_gray(reference, display_range=display_range)
-    base = Image.merge("RGB", (base_gray, base_gray, base_gray))
-
-    overlay_gray = to_display_gray(moving, display_range=display_range)
-    overlay_rgb = ImageOps.colorize(overlay_gray, black=(0, 0, 0), white=moving_color)
-    alpha_value = int(max(0.0, min(opacity, 1.0)) * 255)
-    if alpha_mode == "constant":
-        alpha = Image.new("L", overlay_gray.size, alpha_value)
+    # One gather through a table indexed by the (base, overlay) gray pair; equal to
+    # alpha_composite() of the tinted overlay over the opaque gray base.
+    opacity = max(0.0, min(opacity, 1.0))
+    constant = alpha_mode == "constant"
+    if int(opacity * 255) == 0:
+        # Fully transparent overlay in either mode: the result is the gray base.
+        return to_display_gray(reference, display_range=display_range).convert("RGB")
+    if constant and int(opacity * 255) == 255:
+        # Fully opaque constant overlay hides the base entirely.
+        return tint_channel(moving, moving_color, display_range=display_range)
+    base = np.asarray(to_display_gray(reference, display_range=display_range))
+    overlay = np.asarray(to_display_gray(moving, display_range=display_range))
+    index = base.astype(np.uint16)
+    index <<= 8
+    index |= overlay
+    lut = _composite_lut(tuple(moving_color), opacity, constant)
+    return Image.fromarray(np.take(lut, index, axis=0))
+
+
+@lru_cache(maxsize=8)
+def _composite_lut(color: tuple[int, int, int], opacity: float, constant: bool) -> np.ndarray:
+    # (65536, 3) uint8: row (base << 8 | overlay) holds (tint * a + base * (255 - a) + 127) // 255.
+    base = np.arange(256, dtype=np.uint32)[:, None, None]
+    overlay = np.arange(256)
+    if constant:
+        alpha = np.full(256, int(opacity * 255), dtype=np.uint32)
     else:
-        alpha = overlay_gray.point(lambda v: int(v * max(0.0, min(opacity, 1.0))))
-    overlay = overlay_rgb.copy()
-    overlay.putalpha(alpha)
+        alpha = (overlay * opacity).astype(np.uint32)
+    alpha = alpha[None, :, None]
+    tint = tint_lut(color).astype(np.uint32)[None, :, :]
+    lut = ((tint * alpha + base * (255 - alpha) + 127) // 255).astype(np.uint8).reshape(65536, 3)
+    lut.flags.writeable = False
+    return lut
+
+
+def reference_blend_base(reference_gray: np.ndarray, opacity: float) -> np.ndarray:
+    # Reference share of blend_overlay (plus the rounding offset); constant while only the moving channel changes.
+    alpha = max(0.0, min(opacity, 1.0))
+    base = np.multiply(reference_gray, 1.0 - alpha, dtype=np.float32)
+    np.add(base, 0.5, out=base)
+    return base
+
+
+def blend_uses_base(reference_gray: np.ndarray, moving_gray: np.ndarray) -> bool:
+    # False when blend_overlay() takes the cv2 path, which never reads a reference_blend_base().
+    return not (CV2_AVAILABLE and reference_gray.dtype == np.uint8 and moving_gray.dtype == np.uint8)
+
+
+def blend_overlay(
+    reference_gray: np.ndarray,
+    moving_gray: np.ndarray,
+    moving_color: tuple[int, int, int],
+    opacity: float,
+    out: Optional[np.ndarray] = None,
+    base: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Constant-alpha blend of a tinted moving channel over a gray reference, as (H, W, 3) uint8.
+    # `base` may be a cached reference_blend_base() for the same reference and opacity.
+    alpha = max(0.0, min(opacity, 1.0))
+    if out is None or out.shape != reference_gray.shape + (3,):
+        out = np.empty(reference_gray.shape + (3,), dtype=np.uint8)
+    if not blend_uses_base(reference_gray, moving_gray):
+        # addWeighted does the scale, add and saturating round per band in one pass;
+        # bands sharing a tint value are computed once.
+        bands: dict[int, np.ndarray] = {}
+        for value in moving_color:
+            if value not in bands:
+                bands[value] = cv2.addWeighted(reference_gray, 1.0 - alpha, moving_gray, value * alpha / 255.0, 0.0)
+        cv2.merge([bands[value] for value in moving_color], dst=out)
+        return out
+    if base is None:
+        base = reference_blend_base(reference_gray, alpha)
+    tint = np.empty_like(base)
+    for band, value in enumerate(moving_color):
+        np.multiply(moving_gray, value * alpha / 255.0, out=tint, dtype=np.float32)
+        np.add(tint, base, out=tint)
+        out[..., band] = tint
+    return out
 
-    composed = base.convert("RGBA")
-    composed.alpha_composite(overlay)
-    return composed.convert("RGB")
+
+def downsample(
+    image: Image.Image,
+    size: tuple[int, int],
+    array: Optional[np.ndarray] = None,
+) -> Image.Image:
+    if CV2_AVAILABLE and image.mode in _CV2_MODE_DTYPES:
+        arr = array if array is not None else np.asarray(image)
+        arr = arr.astype(_CV2_MODE_DTYPES[image.mode], copy=False)
+        return Image.fromarray(cv2.resize(arr, size, interpolation=cv2.INTER_AREA))
+    # Two-stage: integer box reduction first, then BOX for the remaining fraction (about 3x
+    # faster than LANCZOS at these ratios); BILINEAR only when asked to upscale.
+    factor = min(image.size[0] // max(size[0], 1), image.size[1] // max(size[1], 1))
+    if factor >= 2:
+        reduced_size = (image.size[0] // factor, image.size[1] // factor)
+        if image.mode.startswith("I;16"):
+            # Image.reduce() has no I;16 support.
+            image = image.resize(reduced_size, resample=Image.BOX)
+        else:
+            image = image.reduce(factor)
+        if image.size == tuple(size):
+            return image
+    upscale = size[0] > image.size[0] or size[1] > image.size[1]
+    return image.resize(size, resample=Image.BILINEAR if upscale else Image.BOX)
+
+
+def resize_array(
+    array: np.ndarray,
+    size: tuple[int, int],
+    resample: int,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # uint8 gray/RGB resize for the viewport blit; writes into ``out`` when its shape fits.
+    width, height = size
+    shape = (height, width) + array.shape[2:]
+    if out is None or out.shape != shape or out.dtype != np.uint8:
+        out = np.empty(shape, dtype=np.uint8)
+    if array.shape[:2] == shape[:2]:
+        np.copyto(out, array)
+        return out
+    if CV2_AVAILABLE:
+        if resample == Image.NEAREST:
+            interpolation = cv2.INTER_NEAREST
+        elif width < array.shape[1] and height < array.shape[0]:
+            # Matches PIL's antialiased BILINEAR when shrinking.
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_LINEAR
+        return cv2.resize(array, size, dst=out, interpolation=interpolation)
+    resized = Image.fromarray(np.ascontiguousarray(array)).resize(size, resample=resample)
+    np.copyto(out, np.asarray(resized))
+    return out
+
+
+def build_pyramid(
+    image: Image.Image,
+    levels: int = 3,
+    array: Optional[np.ndarray] = None,
+    min_dim: int = 0,
+) -> List[Image.Image]:
+    # [full, 1/2, 1/4, ...]; each level is downsampled from the previous one.
+    # Stops after `levels` halvings or once the longest side is <= min_dim.
+    pyramid = [image]
+    for _ in range(levels):
+        width, height = pyramid[-1].size
+        if width < 2 or height < 2 or max(width, height) <= min_dim:
+            break
+        pyramid.append(downsample(pyramid[-1], (width // 2, height // 2), array=array))
+        array = None
+    return pyramid
 
 
 def load_channels_from_paths(paths: Sequence[str]) -> ChannelStack:
@@ -93,45 +579,91 @@ def load_channels_from_paths(paths: Sequence[str]) -> ChannelStack:
 
     if len(paths) > 1:
         channels = []
+        arrays = []
         for idx, path in enumerate(paths):
             image = Image.open(path)
             if idx == 0:
                 tiffinfo = _extract_tiffinfo(image)
                 save_kwargs = _extract_save_kwargs(image)
-            channels.append(image.copy())
+            channel, array = _detach_frame(image)
+            channels.append(channel)
+            arrays.append(array)
             image.close()
         _ensure_same_size(channels)
-        return ChannelStack(channels=channels, source_paths=source_paths, tiffinfo=tiffinfo, save_kwargs=save_kwargs)
+        return ChannelStack(
+            channels=channels,
+            source_paths=source_paths,
+            tiffinfo=tiffinfo,
+            save_kwargs=save_kwargs,
+            channels_np=arrays,
+        )
 
     path = paths[0]
     image = Image.open(path)
 
-    channels: List[Image.Image] = []
     n_frames = getattr(image, "n_frames", 1)
     if n_frames > 1:
         tiffinfo = _extract_tiffinfo(image)
         save_kwargs = _extract_save_kwargs(image)
-        for idx in range(n_frames):
-            image.seek(idx)
-            channels.append(image.copy())
+        channels, arrays = _detach_frames(ImageSequence.Iterator(image))
         _ensure_same_size(channels)
         image.close()
-        return ChannelStack(channels=channels, source_paths=source_paths, tiffinfo=tiffinfo, save_kwargs=save_kwargs)
+        return ChannelStack(
+            channels=channels,
+            source_paths=source_paths,
+            tiffinfo=tiffinfo,
+            save_kwargs=save_kwargs,
+            channels_np=arrays,
+        )
 
     bands = image.getbands()
     if len(bands) > 1:
-        channels = [band.copy() for band in image.split()]
+        channels, arrays = _detach_frames(image.split())
         _ensure_same_size(channels)
         tiffinfo = _extract_tiffinfo(image)
         save_kwargs = _extract_save_kwargs(image)
         image.close()
-        return ChannelStack(channels=channels, source_paths=source_paths, tiffinfo=tiffinfo, save_kwargs=save_kwargs)
+        return ChannelStack(
+            channels=channels,
+            source_paths=source_paths,
+            tiffinfo=tiffinfo,
+            save_kwargs=save_kwargs,
+            channels_np=arrays,
+        )
 
     tiffinfo = _extract_tiffinfo(image)
     save_kwargs = _extract_save_kwargs(image)
-    channel = image.copy()
+    channel, array = _detach_frame(image)
     image.close()
-    return ChannelStack(channels=[channel], source_paths=source_paths, tiffinfo=tiffinfo, save_kwargs=save_kwargs)
+    return ChannelStack(
+        channels=[channel],
+        source_paths=source_paths,
+        tiffinfo=tiffinfo,
+        save_kwargs=save_kwargs,
+        channels_np=[array],
+    )
+
+
+def _detach_frame(frame: Image.Image) -> tuple[Image.Image, np.ndarray]:
+    # Decode once into an ndarray and wrap it: for L and I;16 the image shares that buffer, so
+    # each channel is held once instead of as image.copy() plus a separate np.asarray() copy.
+    array = np.asarray(frame)
+    channel = Image.fromarray(array)
+    if channel.mode != frame.mode:
+        # Palette, bilevel, etc. don't survive the array round trip.
+        channel = frame.copy()
+        array = np.asarray(channel)
+    return channel, array
+
+
+def _detach_frames(frames: Iterable[Image.Image]) -> tuple[List[Image.Image], List[np.ndarray]]:
+    channels: List[Image.Image] = []
+    arrays: List[np.ndarray] = []
+    for frame in frames:
+        channel, array = _detach_frame(frame)
+        channels.append(channel)
+        arrays.append(array)
+    return channels, arrays
 
 
 def save_channels(
@@ -167,9 +699,15 @@ def add_alignment_tag(
 
 
 def _ensure_same_size(channels: Iterable[Image.Image]) -> None:
-    sizes = {im.size for im in channels}
-    if len(sizes) != 1:
+    # Stops at the first mismatch; an empty stack is rejected the same way.
+    channels = iter(channels)
+    first = next(channels, None)
+    if first is None:
         raise ValueError("All channels must have the same dimensions.")
+    size = first.size
+    for im in channels:
+        if im.size != size:
+            raise ValueError("All channels must have the same dimensions.")
 
 
 def _extract_tiffinfo(image: Image.Image) -> Optional[TiffImagePlugin.ImageFileDirectory_v2]:
@@ -208,16 +746,18 @@ def _extract_save_kwargs(image: Image.Image) -> dict:
 
 def _apply_display_levels(image: Image.Image, min_val: float, max_val: float) -> Image.Image:
     if max_val <= min_val:
-        return image.convert("L")
+        # Degenerate range: no mapping, and no copy when the input is already 8-bit.
+        return image if image.mode == "L" else image.convert("L")
     if image.mode not in ("L", "I", "I;16", "F"):
         image = image.convert("L")
-    scale = 255.0 / (max_val - min_val)
+    if image.mode == "L":
+        # PIL's tabled point() maps 8-bit images in C without an ndarray round trip.
+        return image.point(_levels_table(float(min_val), float(max_val)))
+    # One vectorized pass instead of Image.point() with a Python callable, which is a
+    # per-pixel interpreter loop for wide modes and rejects I;16 outright.
+    return Image.fromarray(levels_to_uint8(np.asarray(image), (min_val, max_val)))
 
-    def mapper(v: float) -> int:
-        if v <= min_val:
-            return 0
-        if v >= max_val:
-            return 255
-        return int((v - min_val) * scale)
 
-    return image.point(mapper, mode="L")
+@lru_cache(maxsize=16)
+def _levels_table(min_val: float, max_val: float) -> tuple[int, ...]:
+    return tuple(_levels_lut(min_val, max_val, 1.0).tolist())
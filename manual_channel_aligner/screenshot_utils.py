@@ -3,14 +3,14 @@ from __future__ import annotations
 import re
 from typing import Tuple
 
-GEOMETRY_RE = re.compile(r"^(\d+)x(\d+)\+(-?\d+)\+(-?\d+)$")
+GEOMETRY_RE = re.compile(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)")
 
 
 def parse_geometry(geometry: str) -> Tuple[int, int, int, int]:
-    match = GEOMETRY_RE.match(geometry.strip())
+    match = GEOMETRY_RE.fullmatch(geometry.strip())
     if not match:
         raise ValueError(f"Invalid geometry: {geometry}")
-    width, height, x, y = (int(value) for value in match.groups())
+    width, height, x, y = map(int, match.groups())
     return width, height, x, y
 
 
@@ -1,12 +1,22 @@
+import numpy as np
+import pytest
 from PIL import Image
 
 from manual_channel_aligner.app import (
     affine_matrix_for_crop,
+    center_scroll_fraction,
     clamp_scroll_fraction,
     compute_fit_scale,
+    encode_ppm,
     parse_drop_files,
 )
-from manual_channel_aligner.core import TransformState, apply_transform
+from manual_channel_aligner.core import (
+    TransformState,
+    affine_matrices_batch,
+    affine_matrix_for_state,
+    apply_transform,
+    warp_affine,
+)
 
 
 def test_parse_drop_files_braced():
@@ -16,6 +26,11 @@ def test_parse_drop_files_braced():
     assert paths[1] == "/tmp/other.tif"
 
 
+def test_parse_drop_files_splits_on_whitespace():
+    data = "C:\\data\\stacks\\ch1.tif  /tmp/sample.tif"
+    assert parse_drop_files(data) == ["C:\\data\\stacks\\ch1.tif", "/tmp/sample.tif"]
+
+
 def test_parse_drop_files_empty():
     assert parse_drop_files("") == []
 
@@ -25,6 +40,11 @@ def test_compute_fit_scale():
     assert compute_fit_scale((400, 200), (200, 200)) == 0.5
 
 
+def test_center_scroll_fraction():
+    assert center_scroll_fraction(100, 200) == 0.0
+    assert center_scroll_fraction(400, 100) == 0.375
+
+
 def test_clamp_scroll_fraction():
     assert clamp_scroll_fraction(0.2, scroll_w=100, canvas_w=100) == 0.0
     assert clamp_scroll_fraction(-0.5, scroll_w=200, canvas_w=100) == 0.0
@@ -32,10 +52,8 @@ def test_clamp_scroll_fraction():
 
 
 def test_affine_crop_matches_full_transform():
-    img = Image.new("L", (20, 20))
-    for y in range(20):
-        for x in range(20):
-            img.putpixel((x, y), (x + y * 20) % 256)
+    yy, xx = np.mgrid[0:20, 0:20]
+    img = Image.fromarray(((xx + yy * 20) % 256).astype(np.uint8))
 
     state = TransformState(dx=2.0, dy=-3.0, angle_deg=15.0)
     full = apply_transform(img, state, Image.NEAREST)
@@ -46,4 +64,45 @@ def test_affine_crop_matches_full_transform():
     crop = img.transform((out_w, out_h), Image.AFFINE, matrix, resample=Image.NEAREST, fillcolor=0)
     expected = full.crop((out_x0, out_y0, out_x0 + out_w, out_y0 + out_h))
 
-    assert list(crop.getdata()) == list(expected.getdata())
+    assert np.array_equal(np.asarray(crop), np.asarray(expected))
+
+
+def test_warp_affine_crop_window_matches_full_transform():
+    yy, xx = np.mgrid[0:20, 0:20]
+    img = Image.fromarray(((xx * 11 + yy * 3) % 256).astype(np.uint8))
+
+    state = TransformState(dx=-1.0, dy=2.0, angle_deg=-20.0)
+    full = apply_transform(img, state, Image.NEAREST)
+    matrix = affine_matrix_for_crop(state, img.size, 6, 3)
+    crop = warp_affine(img, matrix, (9, 10), Image.NEAREST)
+
+    assert crop.size == (9, 10)
+    assert np.array_equal(np.asarray(crop), np.asarray(full.crop((6, 3, 15, 13))))
+
+
+def test_affine_matrices_batch_matches_scalar():
+    states = [TransformState(dx=1.5, dy=-2.0, angle_deg=30.0), TransformState(dx=0.0, dy=4.0, angle_deg=-7.5)]
+    sizes = [(20, 10), (8, 8)]
+    batch = affine_matrices_batch(
+        [s.angle_deg for s in states],
+        [s.dx for s in states],
+        [s.dy for s in states],
+        sizes,
+    )
+    assert batch.shape == (2, 6)
+    for row, state, size in zip(batch, states, sizes):
+        assert tuple(row) == pytest.approx(affine_matrix_for_state(state, size))
+
+
+def test_affine_matrix_for_state_tracks_mutated_state():
+    state = TransformState(dx=1.0, dy=0.0, angle_deg=0.0)
+    first = affine_matrix_for_state(state, (10, 10))
+    state.dx = 3.0
+    assert affine_matrix_for_state(state, (10, 10))[2] == pytest.approx(first[2] - 2.0)
+
+
+def test_encode_ppm_header_and_pixels():
+    img = Image.new("RGB", (2, 1), (10, 20, 30))
+    img.putpixel((1, 0), (40, 50, 60))
+    assert encode_ppm(img) == b"P6\n2 1\n255\n" + bytes([10, 20, 30, 40, 50, 60])
+    assert encode_ppm(Image.new("L", (1, 1), 7)) == b"P6\n1 1\n255\n" + bytes([7, 7, 7])
@@ -1,14 +1,25 @@
-from PIL import Image
+import numpy as np
+import pytest
+from PIL import Image, ImageOps
 
 from PIL import TiffImagePlugin
 
+from manual_channel_aligner import core
 from manual_channel_aligner.core import (
     TransformState,
     add_alignment_tag,
     apply_transform,
+    blend_overlay,
+    build_pyramid,
     compose_overlay,
+    display_gray_array,
+    levels_to_uint8,
     load_channels_from_paths,
+    reference_blend_base,
+    resize_array,
     save_channels,
+    tint_channel,
+    to_display_gray,
 )
 
 
@@ -28,7 +39,7 @@ def test_apply_transform_noop():
     img.putpixel((1, 1), 200)
 
     out = apply_transform(img, TransformState(), Image.NEAREST)
-    assert list(out.getdata()) == list(img.getdata())
+    assert np.array_equal(np.asarray(out), np.asarray(img))
 
 
 def test_load_channels_from_paths_rgb(tmp_path):
@@ -41,6 +52,47 @@ def test_load_channels_from_paths_rgb(tmp_path):
     assert stack.channels[0].mode == "L"
 
 
+def test_load_channels_from_paths_keeps_arrays(tmp_path):
+    img = Image.new("I;16", (4, 3), 1000)
+    path = tmp_path / "a.tif"
+    img.save(path)
+
+    stack = load_channels_from_paths([str(path), str(path)])
+    assert len(stack.channels_np) == 2
+    assert stack.channels_np[0].dtype == np.uint16
+    assert stack.channels_np[0].shape == (3, 4)
+
+
+def test_load_channels_from_paths_multipage_keeps_mode_and_pixels(tmp_path):
+    frames = [Image.fromarray(np.full((3, 4), 1000 * (i + 1), dtype=np.uint16)) for i in range(3)]
+    path = tmp_path / "stack.tif"
+    frames[0].save(path, save_all=True, append_images=frames[1:])
+
+    stack = load_channels_from_paths([str(path)])
+
+    assert [channel.mode for channel in stack.channels] == ["I;16"] * 3
+    for channel, array, frame in zip(stack.channels, stack.channels_np, frames):
+        assert np.array_equal(np.asarray(channel), np.asarray(frame))
+        assert np.array_equal(array, np.asarray(frame))
+
+
+def test_load_channels_from_paths_keeps_palette_mode(tmp_path):
+    Image.new("P", (4, 4), 3).save(tmp_path / "a.png")
+    Image.new("P", (4, 4), 5).save(tmp_path / "b.png")
+
+    stack = load_channels_from_paths([str(tmp_path / "a.png"), str(tmp_path / "b.png")])
+
+    assert [channel.mode for channel in stack.channels] == ["P", "P"]
+
+
+def test_load_channels_from_paths_rejects_mismatched_sizes(tmp_path):
+    Image.new("L", (4, 4)).save(tmp_path / "a.png")
+    Image.new("L", (4, 5)).save(tmp_path / "b.png")
+
+    with pytest.raises(ValueError, match="same dimensions"):
+        load_channels_from_paths([str(tmp_path / "a.png"), str(tmp_path / "b.png")])
+
+
 def test_load_channels_from_paths_la(tmp_path):
     img = Image.new("LA", (3, 3), (10, 200))
     path = tmp_path / "la.tif"
@@ -59,6 +111,26 @@ def test_compose_overlay_output():
     assert out.size == (4, 4)
 
 
+@pytest.mark.parametrize("opacity", [0.0, 0.35, 1.0])
+@pytest.mark.parametrize("alpha_mode", ["intensity", "constant"])
+def test_compose_overlay_matches_alpha_composite(alpha_mode, opacity):
+    rng = np.random.default_rng(3)
+    ref = Image.fromarray((rng.random((9, 13)) * 255).astype(np.uint8))
+    mov = Image.fromarray((rng.random((9, 13)) * 255).astype(np.uint8))
+
+    ref, mov = ImageOps.autocontrast(ref), ImageOps.autocontrast(mov)
+    overlay = ImageOps.colorize(mov, black=(0, 0, 0), white=(240, 90, 90))
+    if alpha_mode == "constant":
+        overlay.putalpha(int(opacity * 255))
+    else:
+        overlay.putalpha(mov.point(lambda v: int(v * opacity)))
+    expected = Image.merge("RGB", (ref, ref, ref)).convert("RGBA")
+    expected.alpha_composite(overlay)
+
+    out = compose_overlay(ref, mov, opacity, (240, 90, 90), alpha_mode=alpha_mode)
+    assert np.array_equal(np.asarray(out), np.asarray(expected.convert("RGB")))
+
+
 def test_compose_overlay_constant_alpha_with_levels():
     ref = Image.new("L", (2, 2), 0)
     mov = Image.new("L", (2, 2), 10)
@@ -70,6 +142,83 @@ def test_compose_overlay_constant_alpha_with_levels():
     assert r >= b
 
 
+def test_levels_to_uint8_clips_and_scales():
+    arr = np.array([[0, 100, 200, 300]], dtype=np.uint16)
+
+    out = levels_to_uint8(arr, (100, 200))
+    assert out.dtype == np.uint8
+    assert out.tolist() == [[0, 0, 255, 255]]
+    assert levels_to_uint8(arr, (0, 300), brightness=2.0).tolist() == [[0, 170, 255, 255]]
+
+
+@pytest.mark.parametrize("mode", ["I;16", "I", "F"])
+def test_to_display_gray_levels_high_bit_depth(mode):
+    values = np.array([[0, 100, 150, 200, 300]], dtype=np.uint16)
+    img = Image.fromarray(values).convert(mode) if mode != "I;16" else Image.fromarray(values)
+
+    gray = to_display_gray(img, display_range=(100.0, 200.0))
+
+    assert gray.mode == "L"
+    assert np.asarray(gray).tolist() == [[0, 0, 127, 255, 255]]
+
+
+def test_display_gray_array_matches_pil_path():
+    img = Image.fromarray(np.arange(0, 240, 4, dtype=np.uint8).reshape(6, 10))
+
+    expected = np.asarray(to_display_gray(img, display_range=(20.0, 200.0)))
+    out = display_gray_array(img, (20.0, 200.0))
+    assert out.dtype == np.uint8
+    assert np.abs(out.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_blend_overlay_constant_alpha():
+    ref = np.full((2, 3), 100, dtype=np.uint8)
+    mov = np.full((2, 3), 255, dtype=np.uint8)
+
+    out = blend_overlay(ref, mov, (240, 90, 90), 0.5)
+    assert out.shape == (2, 3, 3)
+    assert out.dtype == np.uint8
+    assert out[0, 0].tolist() == [170, 95, 95]
+    assert np.array_equal(blend_overlay(ref, mov, (240, 90, 90), 0.0)[..., 0], ref)
+    cached = blend_overlay(ref, mov, (240, 90, 90), 0.5, base=reference_blend_base(ref, 0.5))
+    assert np.array_equal(cached, out)
+
+
+def test_blend_overlay_cv2_matches_numpy(monkeypatch):
+    pytest.importorskip("cv2")
+    rng = np.random.default_rng(3)
+    ref = rng.integers(0, 256, size=(20, 30), dtype=np.uint8)[2:15, 4:25]
+    mov = rng.integers(0, 256, size=(13, 21), dtype=np.uint8)
+
+    fast = blend_overlay(ref, mov, (240, 90, 90), 0.37)
+    monkeypatch.setattr(core, "CV2_AVAILABLE", False)
+    expected = blend_overlay(ref, mov, (240, 90, 90), 0.37)
+    assert np.abs(fast.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_tint_lut_matches_colorize():
+    gray = Image.fromarray(np.arange(0, 256, dtype=np.uint8).reshape(16, 16))
+
+    expected = ImageOps.colorize(gray, black=(0, 0, 0), white=(240, 90, 90))
+    assert np.array_equal(np.asarray(tint_channel(gray, (240, 90, 90))), np.asarray(expected))
+
+
+def test_build_pyramid_halves_each_level():
+    img = Image.new("I;16", (40, 18), 500)
+
+    pyramid = build_pyramid(img)
+    assert [level.size for level in pyramid] == [(40, 18), (20, 9), (10, 4), (5, 2)]
+    assert pyramid[0] is img
+    assert all(level.mode == "I;16" for level in pyramid)
+
+
+def test_build_pyramid_stops_at_min_dim():
+    img = Image.new("L", (1000, 600))
+    pyramid = build_pyramid(img, levels=8, min_dim=200)
+    assert [level.size for level in pyramid] == [(1000, 600), (500, 300), (250, 150), (125, 75)]
+    assert len(build_pyramid(img, levels=8, min_dim=1000)) == 1
+
+
 def test_save_channels_multi_page(tmp_path):
     ch1 = Image.new("L", (2, 2), 0)
     ch2 = Image.new("L", (2, 2), 255)
@@ -87,3 +236,128 @@ def test_add_alignment_tag_no_existing():
     info = TiffImagePlugin.ImageFileDirectory_v2()
     updated = add_alignment_tag(info)
     assert updated.get(270) == "Manual Aligned"
+
+
+def test_apply_transform_cv2_matches_pil_nearest(monkeypatch):
+    pytest.importorskip("cv2")
+    yy, xx = np.mgrid[0:12, 0:16]
+    img = Image.fromarray(((xx * 7 + yy * 3) % 256).astype(np.uint8))
+    state = TransformState(dx=2.0, dy=-1.0, angle_deg=12.0)
+
+    warped = apply_transform(img, state, Image.NEAREST)
+    monkeypatch.setattr(core, "CV2_AVAILABLE", False)
+    expected = apply_transform(img, state, Image.NEAREST)
+
+    assert np.count_nonzero(np.asarray(warped) != np.asarray(expected)) <= 2
+
+
+@pytest.mark.parametrize("mode", ["L", "I;16", "F", "RGB"])
+@pytest.mark.parametrize("dx, dy", [(3.0, -2.0), (-5.0, 4.0), (40.0, 0.0)])
+def test_integer_shift_matches_pil_transform(mode, dx, dy):
+    rng = np.random.default_rng(5)
+    shape = (12, 16, 3) if mode == "RGB" else (12, 16)
+    values = rng.random(shape) * 250
+    dtype = {"L": np.uint8, "RGB": np.uint8, "I;16": np.uint16, "F": np.float32}[mode]
+    img = Image.fromarray(values.astype(dtype))
+    state = TransformState(dx=dx, dy=dy)
+    matrix = core.affine_matrix_for_crop(state, img.size, 2, 1)
+
+    shifted = core.warp_affine(img, matrix, (10, 9), Image.BILINEAR)
+    expected = img.transform((10, 9), Image.AFFINE, matrix, resample=Image.NEAREST, fillcolor=0)
+
+    assert shifted.mode == img.mode
+    assert np.array_equal(np.asarray(shifted), np.asarray(expected))
+
+
+def test_apply_transform_cv2_writes_into_out_buffer():
+    pytest.importorskip("cv2")
+    img = Image.fromarray(np.arange(12 * 16, dtype=np.uint8).reshape(12, 16))
+    state = TransformState(dx=1.0, angle_deg=5.0)
+    out = np.zeros((12, 16), dtype=np.uint8)
+
+    warped = apply_transform(img, state, Image.BILINEAR, out=out)
+
+    expected = np.asarray(apply_transform(img, state, Image.BILINEAR))
+    assert np.array_equal(np.asarray(warped), expected)
+    assert np.array_equal(out, expected)
+    mismatched = np.zeros((4, 4), dtype=np.uint8)
+    warped = apply_transform(img, state, Image.BILINEAR, out=mismatched)
+    assert warped.size == (16, 12)
+    assert not mismatched.any()
+
+
+@pytest.mark.parametrize("cv2_available", [True, False])
+def test_resize_array_nearest_and_reuses_out(monkeypatch, cv2_available):
+    if cv2_available:
+        pytest.importorskip("cv2")
+    monkeypatch.setattr(core, "CV2_AVAILABLE", cv2_available)
+    rgb = np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3)
+    out = np.zeros((4, 6, 3), dtype=np.uint8)
+
+    scaled = resize_array(rgb, (6, 4), Image.NEAREST, out=out)
+
+    assert scaled is out
+    assert np.array_equal(scaled, rgb.repeat(2, axis=0).repeat(2, axis=1))
+    same = resize_array(rgb[:, :2], (2, 2), Image.BILINEAR)
+    assert np.array_equal(same, rgb[:, :2])
+
+
+def test_levels_to_uint8_numba_matches_numpy_kernel():
+    pytest.importorskip("numba")
+    arr = np.random.default_rng(0).integers(0, 65536, size=(33, 47), dtype=np.uint16)
+
+    compiled = levels_to_uint8(arr, (1000.0, 40000.0), brightness=1.4)
+    expected = core._levels_kernel(arr, 1000.0, 40000.0, 1.4)
+    assert np.array_equal(compiled, expected)
+
+
+def test_display_levels_on_16bit_image_matches_numpy_kernel():
+    arr = np.random.default_rng(2).integers(0, 65536, size=(19, 26), dtype=np.uint16)
+
+    leveled = core._apply_display_levels(Image.fromarray(arr), 2000.0, 50000.0)
+    assert leveled.mode == "L"
+    assert np.array_equal(np.asarray(leveled), core._levels_kernel(arr, 2000.0, 50000.0, 1.0))
+    # Full-res rendering levels strided channel views rather than whole frames.
+    view = arr[3:15, 5:20]
+    assert np.array_equal(levels_to_uint8(view, (2000.0, 50000.0)), core._levels_kernel(view, 2000.0, 50000.0, 1.0))
+
+
+def test_levels_numexpr_matches_numpy_kernel():
+    pytest.importorskip("numexpr")
+    arr = np.random.default_rng(1).integers(0, 65536, size=(21, 30), dtype=np.uint16)
+
+    expected = core._levels_kernel(arr, 500.0, 30000.0, 0.7)
+    assert np.array_equal(core._levels_numexpr(arr, 500.0, 30000.0, 0.7), expected)
+
+
+def test_warp_affine_numba_matches_pil_bilinear(monkeypatch):
+    pytest.importorskip("numba")
+    monkeypatch.setattr(core, "CV2_AVAILABLE", False)
+    yy, xx = np.mgrid[0:30, 0:40]
+    img = Image.fromarray(((xx * 9 + yy * 5) % 256).astype(np.uint8))
+    state = TransformState(dx=1.3, dy=-2.7, angle_deg=17.0)
+
+    warped = apply_transform(img, state, Image.BILINEAR)
+    monkeypatch.setattr(core, "NUMBA_AVAILABLE", False)
+    expected = apply_transform(img, state, Image.BILINEAR)
+    assert np.array_equal(np.asarray(warped), np.asarray(expected))
+
+
+def test_levels_to_uint8_lut_matches_float_path():
+    arr = np.arange(256, dtype=np.uint8).reshape(16, 16)
+
+    via_lut = levels_to_uint8(arr, (10.0, 200.0), brightness=1.3)
+    via_float = levels_to_uint8(arr.astype(np.float32), (10.0, 200.0), brightness=1.3)
+    assert np.array_equal(via_lut, via_float)
+
+
+def test_downsample_pil_fallback_reduces_then_resizes(monkeypatch):
+    monkeypatch.setattr(core, "CV2_AVAILABLE", False)
+    for mode in ("L", "I;16", "F"):
+        img = Image.new(mode, (50, 37), 200)
+        assert core.downsample(img, (25, 18)).size == (25, 18)
+        out = core.downsample(img, (11, 9))
+        assert out.size == (11, 9)
+        assert out.mode == mode
+        assert out.getextrema() == (200, 200)
+        assert core.downsample(img, (60, 40)).getextrema() == (200, 200)